@@ -13,15 +13,31 @@ Key Components:
 
 Functions/Classes:
 - `initialize_session_state()`: Initialize Streamlit session variables
+- `new_analysis_history()`: Empty columnar analysis history
+- `append_analysis_history(history, path, total_issues, total_files)`: Amortized O(1) history append
 - `setup_rag_and_chatbot()`: Initialize RAG system and chatbot
-- `@st.cache_data run_analysis(path, branch=None)`: Cached analysis execution
-- `run_codebase_info(path)`: Get codebase information
+- `@st.cache_data run_analysis(path, branch=None, _on_phase=None)`: Cached analysis execution with progress relay
+- `content_digest(text)`: Short content hash shared by the cache fingerprints
+- `codebase_fingerprint(path)`: Fingerprint the analyzable files of a local tree for cache invalidation
+- `@st.cache_data run_codebase_info(path, fingerprint=None)`: Cached codebase information
+- `build_issues_df(issues)`: Build the issues DataFrame
+- `aggregate_issues(results)`: Pre-bin issue counts by severity, category and file
+- `build_files_df(file_analyses, by_file)`: Build the per-file severity table
+- `results_fingerprint(results)`: Content hash of analysis results
+- `set_analysis_results(results)`: Store results and their DataFrames in session state
+- `load_more_issues()`: Reveal the next page of Top Issues
 - `create_overview_metrics(results)`: Create metrics dashboard
-- `create_severity_chart(issues)`: Create severity distribution chart
-- `create_category_chart(issues)`: Create category distribution chart
-- `create_file_analysis_table(results)`: Create file analysis table
+- `@st.cache_resource chart_template()`: Shared Plotly layout template
+- `@st.cache_data severity_figure(counts)`: Memoized severity pie
+- `@st.cache_data category_figure(counts)`: Memoized category bar chart
+- `create_severity_chart(severity_counts)`: Create severity distribution chart
+- `create_category_chart(category_counts)`: Create category distribution chart
+- `create_file_analysis_table(files_df)`: Create file analysis table
+- `@st.fragment chat_fragment()`: Chat history and input rerun as a fragment
 - `create_chatbot_interface()`: Create chat interface
 - `create_rag_stats()`: Create RAG statistics display
+- `@st.cache_data get_groq_api_key()`: Cached Groq API key lookup
+- `@st.cache_data probe_dependencies(modules)`: Cached installed-module check
 - **`setup_page()`**: Configuration and setup page
 - `info_page()`: Codebase information page
 - `analyze_page()`: Main analysis page with tabs
@@ -30,19 +46,25 @@ Functions/Classes:
 """
 
 import streamlit as st
-import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
-import json
+import importlib.util
 import asyncio
+import queue
 import sys
 import os
 from datetime import datetime
 from pathlib import Path
 import tempfile
 import shutil
-from typing import Optional, Dict, Any
+import hashlib
+from typing import Optional, Dict, Any, Callable, TYPE_CHECKING
+from concurrent.futures import ThreadPoolExecutor
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+# pandas/plotly are imported inside the functions that draw tables and charts
+# so the Home and Setup pages start without loading them
+PLOTLY_RESAMPLER_AVAILABLE = importlib.util.find_spec("plotly_resampler") is not None
 
 # Add parent directory to path to import the package
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -53,12 +75,15 @@ try:
     from code_quality_agent.rag_system import CodeRAGSystem
     from code_quality_agent.config import Config
     from code_quality_agent.report_generator import ReportGenerator
-    from code_quality_agent.utils.file_handler import FileHandler
+    from code_quality_agent.utils.file_handler import FileHandler, summarize_file
+    from code_quality_agent.utils import json_codec
 except ImportError as e:
     st.error(f"Failed to import code_quality_agent package: {e}")
     st.error("Please ensure the package is installed: pip install code-quality-intelligence")
     st.stop()
 
+from config import CACHE_TTL, STATIC_DIR, SEVERITY_COLORS
+
 # Page configuration
 st.set_page_config(
     page_title="Code Quality Intelligence Agent",
@@ -67,62 +92,24 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Custom CSS
-st.markdown("""
-<style>
-    .main-header {
-        font-size: 2.5rem;
-        color: #1f77b4;
-        text-align: center;
-        margin-bottom: 2rem;
-    }
-    .metric-card {
-        background-color: #f0f2f6;
-        padding: 1rem;
-        border-radius: 0.5rem;
-        border-left: 4px solid #1f77b4;
-    }
-    .chat-message {
-        padding: 1rem;
-        border-radius: 0.5rem;
-        margin: 0.5rem 0;
-    }
-    .user-message {
-        background-color: #e3f2fd;
-        border-left: 4px solid #2196f3;
-    }
-    .assistant-message {
-        background-color: #f3e5f5;
-        border-left: 4px solid #9c27b0;
-    }
-    .success-box {
-        background-color: #d4edda;
-        border: 1px solid #c3e6cb;
-        border-radius: 0.25rem;
-        padding: 0.75rem;
-        margin: 1rem 0;
-    }
-    .error-box {
-        background-color: #f8d7da;
-        border: 1px solid #f5c6cb;
-        border-radius: 0.25rem;
-        padding: 0.75rem;
-        margin: 1rem 0;
-    }
-    .warning-box {
-        background-color: #fff3cd;
-        border: 1px solid #ffeaa7;
-        border-radius: 0.25rem;
-        padding: 0.75rem;
-        margin: 1rem 0;
-    }
-</style>
-""", unsafe_allow_html=True)
+@st.cache_resource
+def load_css() -> str:
+    """Read the custom stylesheet once per server process."""
+    return f"<style>\n{(STATIC_DIR / 'style.css').read_text(encoding='utf-8')}</style>"
+
+# Custom CSS (must be emitted on every run or Streamlit drops it from the page)
+st.markdown(load_css(), unsafe_allow_html=True)
 
 def initialize_session_state():
     """Initialize session state variables."""
     if 'analysis_results' not in st.session_state:
         st.session_state.analysis_results = None
+    if 'files_df' not in st.session_state:
+        st.session_state.files_df = None
+    if 'analysis_hash' not in st.session_state:
+        st.session_state.analysis_hash = None
+    if 'issue_page' not in st.session_state:
+        st.session_state.issue_page = 1
     if 'chatbot' not in st.session_state:
         st.session_state.chatbot = None
     if 'rag_system' not in st.session_state:
@@ -130,12 +117,43 @@ def initialize_session_state():
     if 'chat_history' not in st.session_state:
         st.session_state.chat_history = []
     if 'analysis_history' not in st.session_state:
-        st.session_state.analysis_history = []
+        st.session_state.analysis_history = new_analysis_history()
     if 'setup_complete' not in st.session_state:
         st.session_state.setup_complete = False
     if 'api_key_configured' not in st.session_state:
         st.session_state.api_key_configured = False
 
+HISTORY_CAPACITY = 16
+
+def new_analysis_history(capacity: int = HISTORY_CAPACITY) -> Dict[str, Any]:
+    """Create an empty columnar analysis history backed by NumPy arrays."""
+    import numpy as np
+    
+    return {
+        'size': 0,
+        'timestamp': np.empty(capacity, dtype='datetime64[ns]'),
+        'path': np.empty(capacity, dtype=object),
+        'total_issues': np.zeros(capacity, dtype=np.int32),
+        'total_files': np.zeros(capacity, dtype=np.int32)
+    }
+
+def append_analysis_history(history: Dict[str, Any], path: str, total_issues: int, total_files: int):
+    """Append one analysis run, doubling the arrays when they are full."""
+    import numpy as np
+    
+    n = history['size']
+    if n == len(history['timestamp']):
+        for column in ('timestamp', 'path', 'total_issues', 'total_files'):
+            grown = np.empty(2 * n, dtype=history[column].dtype)
+            grown[:n] = history[column]
+            history[column] = grown
+    
+    history['timestamp'][n] = np.datetime64(datetime.now(), 'ns')
+    history['path'][n] = path
+    history['total_issues'][n] = total_issues
+    history['total_files'][n] = total_files
+    history['size'] = n + 1
+
 def setup_rag_and_chatbot():
     """Initialize RAG system and chatbot."""
     if st.session_state.rag_system is None:
@@ -145,21 +163,65 @@ def setup_rag_and_chatbot():
         st.session_state.chatbot = CodeQualityChatbot(st.session_state.rag_system)
 
 @st.cache_data
-def run_analysis(path: str, branch: Optional[str] = None) -> Dict[str, Any]:
-    """Run code analysis with caching."""
+def run_analysis(path: str, branch: Optional[str] = None,
+                 _on_phase: Optional[Callable[[str], None]] = None) -> Dict[str, Any]:
+    """Run code analysis with caching.
+
+    ``_on_phase`` (excluded from the cache key) receives progress labels on
+    the script thread while the analysis runs.
+    """
     try:
         agent = CodeQualityAgent()
-        # Use asyncio in a thread-safe way for Streamlit
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        results = loop.run_until_complete(agent.analyze_codebase(path, branch=branch))
-        loop.close()
+        phases: "queue.Queue[str]" = queue.Queue()
+        # Run the event loop on a worker thread so the script thread never hosts a loop
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            future = pool.submit(asyncio.run, agent.analyze_codebase(path, branch=branch, progress=phases.put))
+            # Relay progress to Streamlit from the script thread
+            while True:
+                try:
+                    phase = phases.get(timeout=0.1)
+                except queue.Empty:
+                    if future.done():
+                        break
+                    continue
+                if _on_phase:
+                    _on_phase(phase)
+            results = future.result()
+        # Pre-bin counts here so they live in the cache alongside the results
+        if 'error' not in results:
+            results['_aggs'] = aggregate_issues(results)
         return results
     except Exception as e:
         return {"error": str(e)}
 
-def run_codebase_info(path: str) -> Dict[str, Any]:
-    """Get codebase information without full analysis."""
+def content_digest(text: str) -> str:
+    """Short content hash shared by the cache fingerprints."""
+    return hashlib.blake2b(text.encode('utf-8', 'surrogateescape'), digest_size=16).hexdigest()
+
+def codebase_fingerprint(path: str) -> str:
+    """Fingerprint the files FileHandler would analyze from their paths, mtimes and sizes.
+
+    Ignored trees (.git, node_modules, ...) and unsupported files are left out,
+    so unrelated changes such as a git fetch keep cached results valid.
+    """
+    lines = []
+    for entry in sorted(FileHandler().get_code_files(path)):
+        try:
+            stat = entry.stat()
+        except OSError:
+            continue
+        lines.append(f"{entry}\0{stat.st_mtime_ns}\0{stat.st_size}\n")
+    return content_digest("".join(lines))
+
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False)
+def run_codebase_info(path: str, fingerprint: Optional[str] = None) -> Dict[str, Any]:
+    """Get codebase information without full analysis.
+
+    ``fingerprint`` only participates in the cache key so results are
+    invalidated when the tree changes.
+    """
+    import pandas as pd
+    
     try:
         file_handler = FileHandler()
         files = file_handler.get_code_files(path)
@@ -167,31 +229,105 @@ def run_codebase_info(path: str) -> Dict[str, Any]:
         if not files:
             return {"error": "No supported code files found"}
         
-        # Language distribution
-        language_counts = {}
-        total_size = 0
-        total_lines = 0
-        
-        for file_path in files:
-            language = file_handler.detect_language(file_path)
-            language_counts[language] = language_counts.get(language, 0) + 1
-            
-            stats = file_handler.get_file_stats(file_path)
-            total_size += stats.get('size_bytes', 0)
-            total_lines += stats.get('total_lines', 0)
+        # Stat/read calls are I/O-bound, so overlap them on a thread pool; a
+        # forked process pool would copy the Streamlit server's threads and state
+        with ThreadPoolExecutor(max_workers=min(32, len(files))) as pool:
+            summaries = list(pool.map(summarize_file, files))
+        df = pd.DataFrame(summaries, columns=['language', 'size', 'lines'])
         
         file_handler.cleanup()
         
+        language_counts = {lang: int(n) for lang, n in df.groupby('language').size().items()}
+        
         return {
             "total_files": len(files),
-            "total_size_kb": total_size / 1024,
-            "total_lines": total_lines,
+            "total_size_kb": int(df['size'].sum()) / 1024,
+            "total_lines": int(df['lines'].sum()),
             "languages": language_counts,
             "files": files
         }
     except Exception as e:
         return {"error": str(e)}
 
+ISSUE_COLUMNS = ['severity', 'category', 'title', 'file_path', 'line_number']
+SEVERITY_COLUMNS = ['critical', 'high', 'medium', 'low']
+ISSUES_PAGE_SIZE = 10
+MAX_FILE_ROWS = 500
+
+def build_issues_df(issues: list) -> "pd.DataFrame":
+    """Build the issues DataFrame shared by the metrics and charts."""
+    import pandas as pd
+    
+    df = pd.DataFrame(issues, columns=ISSUE_COLUMNS)
+    df['severity'] = df['severity'].fillna('info')
+    df['category'] = df['category'].fillna('unknown')
+    return df
+
+def aggregate_issues(results: Dict[str, Any]) -> Dict[str, Any]:
+    """Pre-bin issue counts by severity, category and file."""
+    import pandas as pd
+    
+    issues_df = build_issues_df(results.get('issues', []))
+    severities = pd.DataFrame(
+        [
+            (file_path, issue.get('severity', 'info'))
+            for file_path, analysis in results.get('file_analyses', {}).items()
+            for issue in analysis.get('issues', [])
+        ],
+        columns=['Full Path', 'severity']
+    )
+    by_file = pd.crosstab(severities['Full Path'], severities['severity'])
+    
+    return {
+        'severity': {k: int(v) for k, v in issues_df.groupby('severity').size().items()},
+        'category': {k: int(v) for k, v in issues_df.groupby('category').size().items()},
+        'by_file': {
+            file_path: {k: int(v) for k, v in row.items()}
+            for file_path, row in by_file.to_dict(orient='index').items()
+        }
+    }
+
+def build_files_df(file_analyses: Dict[str, Any], by_file: Dict[str, Dict[str, int]]) -> "pd.DataFrame":
+    """Build the per-file table from pre-binned severity counts."""
+    import pandas as pd
+    
+    files_df = pd.DataFrame(
+        [
+            (file_path, analysis.get('metrics', {}).get('complexity_score', 0), analysis.get('debug', {}).get('language', 'unknown'))
+            for file_path, analysis in file_analyses.items()
+        ],
+        columns=['Full Path', 'Complexity', 'Language']
+    )
+    counts = pd.DataFrame.from_dict(by_file, orient='index').reindex(index=files_df['Full Path']).fillna(0).astype(int)
+    
+    files_df.insert(0, 'File', files_df['Full Path'].map(lambda fp: Path(fp).name))
+    files_df.insert(2, 'Issues', counts.sum(axis=1).astype(int).to_numpy())
+    for position, severity in enumerate(SEVERITY_COLUMNS, start=3):
+        column = counts[severity].to_numpy() if severity in counts.columns else 0
+        files_df.insert(position, severity.title(), column)
+    return files_df
+
+def results_fingerprint(results: Dict[str, Any]) -> str:
+    """Content hash of analysis results, used to detect context changes."""
+    return content_digest(json_codec.dumps(results, sort_keys=True, default=str))
+
+def set_analysis_results(results: Optional[Dict[str, Any]]):
+    """Store analysis results and materialize their DataFrames once."""
+    st.session_state.analysis_results = results
+    st.session_state.issue_page = 1
+    if results and 'error' not in results:
+        if '_aggs' not in results:
+            results['_aggs'] = aggregate_issues(results)
+        st.session_state.files_df = build_files_df(results.get('file_analyses', {}), results['_aggs']['by_file'])
+        st.session_state.analysis_hash = results_fingerprint(results)
+    else:
+        st.session_state.files_df = None
+        st.session_state.analysis_hash = None
+
+def load_more_issues():
+    """Reveal the next page of the Top Issues list."""
+    st.session_state.issue_page += 1
+
 def create_overview_metrics(results: Dict[str, Any]):
     """Create overview metrics display."""
     if not results or 'error' in results:
@@ -199,7 +335,7 @@ def create_overview_metrics(results: Dict[str, Any]):
         return
     
     summary = results.get('summary', {})
-    issues = results.get('issues', [])
+    aggs = results.get('_aggs') or aggregate_issues(results)
     
     col1, col2, col3, col4 = st.columns(4)
     
@@ -210,7 +346,7 @@ def create_overview_metrics(results: Dict[str, Any]):
         )
     
     with col2:
-        critical_high = len([i for i in issues if i.get('severity') in ['high', 'critical']])
+        critical_high = aggs['severity'].get('high', 0) + aggs['severity'].get('critical', 0)
         st.metric(
             label="Total Issues",
             value=summary.get('total_issues', 0),
@@ -226,103 +362,126 @@ def create_overview_metrics(results: Dict[str, Any]):
         )
     
     with col4:
-        security_issues = len([i for i in issues if i.get('category') == 'security'])
+        security_issues = aggs['category'].get('security', 0)
         st.metric(
             label="Security Issues",
             value=security_issues,
             delta="Critical priority" if security_issues > 0 else "All clear"
         )
 
-def create_severity_chart(issues: list):
+@st.cache_resource
+def chart_template():
+    """Layout template shared by the distribution charts."""
+    import plotly.graph_objects as go
+    
+    return go.layout.Template(layout=dict(
+        colorway=list(SEVERITY_COLORS.values()),
+        margin=dict(l=10, r=10, t=40, b=10)
+    ))
+
+@st.cache_data(show_spinner=False)
+def severity_figure(counts: tuple):
+    """Build the severity pie for sorted (severity, count) pairs."""
+    import plotly.graph_objects as go
+    
+    names = [severity.title() for severity, _ in counts]
+    return go.Figure(
+        data=go.Pie(
+            values=[n for _, n in counts],
+            labels=names,
+            marker=dict(colors=[SEVERITY_COLORS.get(name, '#999999') for name in names]),
+            textposition='inside',
+            textinfo='percent+label'
+        ),
+        layout=dict(template=chart_template(), title="Issues by Severity")
+    )
+
+@st.cache_data(show_spinner=False)
+def category_figure(counts: tuple):
+    """Build the category bar chart for sorted (category, count) pairs."""
+    import plotly.graph_objects as go
+    
+    # Pre-binned counts drawn as a single trace
+    values = [n for _, n in counts]
+    return go.Figure(
+        data=go.Bar(
+            x=values,
+            y=[category.replace('_', ' ').title() for category, _ in counts],
+            orientation='h',
+            marker=dict(color=values, colorscale='viridis')
+        ),
+        layout=dict(
+            template=chart_template(),
+            title="Issues by Category",
+            showlegend=False,
+            yaxis={'categoryorder': 'total ascending'}
+        )
+    )
+
+def create_severity_chart(severity_counts: Dict[str, int]):
     """Create severity distribution chart."""
-    if not issues:
+    if not severity_counts:
         st.info("No issues to display")
         return
     
-    severity_counts = {}
-    for issue in issues:
-        severity = issue.get('severity', 'info').title()
-        severity_counts[severity] = severity_counts.get(severity, 0) + 1
-    
-    fig = px.pie(
-        values=list(severity_counts.values()),
-        names=list(severity_counts.keys()),
-        title="Issues by Severity",
-        color_discrete_map={
-            'Critical': '#ff4444',
-            'High': '#ff8800',
-            'Medium': '#ffbb33',
-            'Low': '#00C851',
-            'Info': '#33b5e5'
-        }
-    )
-    
-    fig.update_traces(textposition='inside', textinfo='percent+label')
+    fig = severity_figure(tuple(sorted(severity_counts.items())))
     st.plotly_chart(fig, use_container_width=True)
 
-def create_category_chart(issues: list):
+def create_category_chart(category_counts: Dict[str, int]):
     """Create category distribution chart."""
-    if not issues:
+    if not category_counts:
         return
     
-    category_counts = {}
-    for issue in issues:
-        category = issue.get('category', 'unknown').replace('_', ' ').title()
-        category_counts[category] = category_counts.get(category, 0) + 1
-    
-    fig = px.bar(
-        x=list(category_counts.values()),
-        y=list(category_counts.keys()),
-        orientation='h',
-        title="Issues by Category",
-        color=list(category_counts.values()),
-        color_continuous_scale='viridis'
-    )
-    
-    fig.update_layout(showlegend=False, yaxis={'categoryorder': 'total ascending'})
+    fig = category_figure(tuple(sorted(category_counts.items())))
     st.plotly_chart(fig, use_container_width=True)
 
-def create_file_analysis_table(results: Dict[str, Any]):
+def create_file_analysis_table(files_df: "pd.DataFrame"):
     """Create file analysis table."""
-    file_analyses = results.get('file_analyses', {})
-    if not file_analyses:
+    import pandas as pd
+    
+    if files_df is None or files_df.empty:
         st.info("No file analysis data available")
         return
     
-    table_data = []
-    for file_path, analysis in file_analyses.items():
-        issues = analysis.get('issues', [])
-        metrics = analysis.get('metrics', {})
-        
-        severity_counts = {}
-        for issue in issues:
-            severity = issue.get('severity', 'info')
-            severity_counts[severity] = severity_counts.get(severity, 0) + 1
+    # Bin issue counts up front instead of styling cell by cell
+    table_df = files_df.assign(
+        Risk=pd.cut(files_df['Issues'], bins=[-1, 2, 5, float('inf')], labels=['ok', 'warn', 'bad'])
+    )
+    st.dataframe(
+        table_df,
+        use_container_width=True,
+        column_config={
+            'Issues': st.column_config.ProgressColumn(
+                'Issues', format='%d', min_value=0, max_value=max(int(files_df['Issues'].max()), 1)
+            )
+        }
+    )
+
+@st.fragment
+def chat_fragment():
+    """Chat history and input; reruns on its own when a message is sent."""
+    if st.button("Clear Chat"):
+        st.session_state.chat_history = []
+        st.session_state.chatbot.clear_conversation()
+    
+    # Display chat history
+    for message in st.session_state.chat_history:
+        st.chat_message("user").write(message["user"])
+        st.chat_message("assistant").write(message["assistant"])
+    
+    # Chat input submits on Enter and returns the message on that rerun
+    user_input = st.chat_input("e.g., What security issues did you find?")
+    if user_input:
+        st.chat_message("user").write(user_input)
+        with st.chat_message("assistant"):
+            with st.spinner("Thinking..."):
+                response = st.session_state.chatbot.chat(user_input)
+            st.write(response)
         
-        table_data.append({
-            'File': Path(file_path).name,
-            'Full Path': file_path,
-            'Issues': len(issues),
-            'Critical': severity_counts.get('critical', 0),
-            'High': severity_counts.get('high', 0),
-            'Medium': severity_counts.get('medium', 0),
-            'Low': severity_counts.get('low', 0),
-            'Complexity': metrics.get('complexity_score', 0),
-            'Language': analysis.get('debug', {}).get('language', 'unknown')
+        st.session_state.chat_history.append({
+            "user": user_input,
+            "assistant": response
         })
-    
-    if table_data:
-        df = pd.DataFrame(table_data)
-        
-        def highlight_issues(val):
-            if val > 5:
-                return 'background-color: #ffcccc'
-            elif val > 2:
-                return 'background-color: #fff2cc'
-            return ''
-        
-        styled_df = df.style.applymap(highlight_issues, subset=['Issues', 'Critical', 'High'])
-        st.dataframe(styled_df, use_container_width=True)
 
 def create_chatbot_interface():
     """Create chatbot interface."""
@@ -330,49 +489,22 @@ def create_chatbot_interface():
     
     setup_rag_and_chatbot()
     
+    # Only push context (and re-index RAG) when the analysis actually changed
     if st.session_state.analysis_results and st.session_state.chatbot:
-        st.session_state.chatbot.set_analysis_context(st.session_state.analysis_results)
+        if st.session_state.get('last_ctx_hash') != st.session_state.analysis_hash:
+            st.session_state.chatbot.set_analysis_context(st.session_state.analysis_results)
+            st.session_state.last_ctx_hash = st.session_state.analysis_hash
     
     if st.session_state.chatbot:
-        # Display chat history
-        for message in st.session_state.chat_history:
-            with st.container():
-                st.markdown(
-                    f'<div class="chat-message user-message"><strong>You:</strong> {message["user"]}</div>',
-                    unsafe_allow_html=True
-                )
-                st.markdown(
-                    f'<div class="chat-message assistant-message"><strong>Assistant:</strong> {message["assistant"]}</div>',
-                    unsafe_allow_html=True
-                )
-        
-        # Chat input
-        user_input = st.text_input("Ask about your code:", placeholder="e.g., What security issues did you find?")
-        
-        col1, col2 = st.columns([1, 4])
-        with col1:
-            if st.button("Send", type="primary"):
-                if user_input:
-                    with st.spinner("Thinking..."):
-                        response = st.session_state.chatbot.chat(user_input)
-                    
-                    st.session_state.chat_history.append({
-                        "user": user_input,
-                        "assistant": response
-                    })
-                    st.rerun()
-        
-        with col2:
-            if st.button("Clear Chat"):
-                st.session_state.chat_history = []
-                if st.session_state.chatbot:
-                    st.session_state.chatbot.clear_conversation()
-                st.rerun()
+        chat_fragment()
     else:
         st.warning("Chatbot not available. Please check your API key configuration.")
 
 def create_rag_stats():
     """Create RAG system statistics."""
+    import pandas as pd
+    import plotly.express as px
+    
     if st.session_state.rag_system and st.session_state.rag_system.is_available():
         stats = st.session_state.rag_system.get_collection_stats()
         
@@ -395,6 +527,23 @@ def create_rag_stats():
     else:
         st.info("RAG system not available or not initialized")
 
+SETUP_DEPENDENCIES = {
+    "langchain": "LangChain",
+    "langchain_groq": "LangChain-Groq", 
+    "git": "GitPython",
+    "streamlit": "Streamlit"
+}
+
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False)
+def get_groq_api_key() -> str:
+    """Cached lookup of the Groq API key (cleared when a new key is saved)."""
+    return Config.get_groq_api_key()
+
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False)
+def probe_dependencies(modules: tuple) -> Dict[str, bool]:
+    """Check which modules are installed without importing them."""
+    return {module: importlib.util.find_spec(module) is not None for module in modules}
+
 def setup_page():
     """Setup page for configuration."""
     st.header("Setup & Configuration")
@@ -402,7 +551,7 @@ def setup_page():
     # API Key Configuration
     st.subheader("API Key Setup")
     
-    current_key = Config.get_groq_api_key()
+    current_key = get_groq_api_key()
     if current_key:
         st.success("Groq API key is configured")
         st.session_state.api_key_configured = True
@@ -415,6 +564,7 @@ def setup_page():
         if new_key:
             # Save to environment
             os.environ['GROQ_API_KEY'] = new_key
+            get_groq_api_key.clear()
             st.success("API key saved!")
             st.session_state.api_key_configured = True
             st.rerun()
@@ -424,19 +574,13 @@ def setup_page():
     # Dependencies Check
     st.subheader("Dependencies Check")
     
-    dependencies = {
-        "langchain": "LangChain",
-        "langchain_groq": "LangChain-Groq", 
-        "git": "GitPython",
-        "streamlit": "Streamlit"
-    }
+    installed = probe_dependencies(tuple(SETUP_DEPENDENCIES))
     
     missing_deps = []
-    for module, name in dependencies.items():
-        try:
-            __import__(module)
+    for module, name in SETUP_DEPENDENCIES.items():
+        if installed[module]:
             st.success(f"{name}")
-        except ImportError:
+        else:
             missing_deps.append(module)
             st.error(f"{name}")
     
@@ -449,6 +593,9 @@ def setup_page():
 
 def info_page():
     """Codebase information page."""
+    import pandas as pd
+    import plotly.express as px
+    
     st.header("Codebase Information")
     
     st.subheader("Quick Analysis")
@@ -465,7 +612,7 @@ def info_page():
         if path_input:
             with st.spinner("Analyzing codebase structure..."):
                 if analysis_type == "Local Path":
-                    info_results = run_codebase_info(path_input)
+                    info_results = run_codebase_info(path_input, codebase_fingerprint(path_input))
                 else:
                     # For GitHub repos, we need to clone first
                     st.info("GitHub repository analysis requires full analysis. Please use the Analyze page.")
@@ -497,13 +644,23 @@ def info_page():
                 
                 # File list
                 st.subheader("Files Found")
-                files_df = pd.DataFrame(info_results['files'], columns=['File Path'])
-                st.dataframe(files_df, use_container_width=True)
+                files_df = pd.DataFrame({'File Path': [str(f) for f in info_results['files']]})
+                if len(files_df) > MAX_FILE_ROWS:
+                    st.caption(f"Showing the first {MAX_FILE_ROWS} of {len(files_df)} files")
+                st.data_editor(files_df.head(MAX_FILE_ROWS), use_container_width=True, disabled=True)
+                st.download_button(
+                    "Download full list",
+                    files_df.to_csv(index=False).encode('utf-8'),
+                    "files.csv",
+                    mime="text/csv"
+                )
         else:
             st.error("Please enter a path or GitHub URL")
 
 def analyze_page():
     """Main analysis page."""
+    import plotly.graph_objects as go
+    
     st.header("Code Analysis")
     
     # Analysis settings
@@ -526,17 +683,24 @@ def analyze_page():
     # Analysis button
     if st.button("Analyze Code", type="primary"):
         if path_input:
-            with st.spinner("Analyzing code... This may take a few minutes."):
-                results = run_analysis(path_input, branch_input)
-                st.session_state.analysis_results = results
+            with st.status("Analyzing code... This may take a few minutes.", expanded=True) as status:
+                results = run_analysis(
+                    path_input, branch_input,
+                    _on_phase=lambda phase: status.update(label=phase)
+                )
+                set_analysis_results(results)
+                if 'error' in results:
+                    status.update(label="Analysis failed", state="error")
+                else:
+                    status.update(label="Analysis complete", state="complete", expanded=False)
                 
                 if 'error' not in results:
-                    st.session_state.analysis_history.append({
-                        'timestamp': datetime.now(),
-                        'path': path_input,
-                        'total_issues': results.get('summary', {}).get('total_issues', 0),
-                        'total_files': results.get('summary', {}).get('total_files', 0)
-                    })
+                    append_analysis_history(
+                        st.session_state.analysis_history,
+                        path_input,
+                        results.get('summary', {}).get('total_issues', 0),
+                        results.get('summary', {}).get('total_files', 0)
+                    )
             
             st.rerun()
         else:
@@ -564,17 +728,34 @@ def analyze_page():
                         st.markdown(f"{i}. {rec}")
                 
                 # Quality trends
-                if st.session_state.analysis_history:
+                history = st.session_state.analysis_history
+                if history['size']:
                     st.subheader("Quality Trends")
-                    df = pd.DataFrame(st.session_state.analysis_history)
-                    df['timestamp'] = pd.to_datetime(df['timestamp'])
+                    n = history['size']
+                    timestamps = history['timestamp'][:n]
+                    total_issues = history['total_issues'][:n]
                     
-                    fig = px.line(
-                        df, 
-                        x='timestamp', 
-                        y='total_issues',
+                    # WebGL trace keeps hover responsive as history grows;
+                    # downsample server-side when plotly-resampler is installed
+                    if PLOTLY_RESAMPLER_AVAILABLE:
+                        from plotly_resampler import FigureResampler
+                        fig = FigureResampler(go.Figure())
+                        fig.add_trace(
+                            go.Scattergl(mode='lines+markers', name='Total Issues'),
+                            hf_x=timestamps,
+                            hf_y=total_issues
+                        )
+                    else:
+                        fig = go.Figure(go.Scattergl(
+                            x=timestamps,
+                            y=total_issues,
+                            mode='lines+markers',
+                            name='Total Issues'
+                        ))
+                    fig.update_layout(
                         title='Code Quality Over Time',
-                        markers=True
+                        xaxis_title='timestamp',
+                        yaxis_title='total_issues'
                     )
                     st.plotly_chart(fig, use_container_width=True)
             
@@ -583,20 +764,21 @@ def analyze_page():
                 
                 col1, col2 = st.columns(2)
                 with col1:
-                    create_severity_chart(results.get('issues', []))
+                    create_severity_chart(results['_aggs']['severity'])
                 with col2:
-                    create_category_chart(results.get('issues', []))
+                    create_category_chart(results['_aggs']['category'])
             
             with tab3:
                 st.header("Detailed Analysis")
                 
                 st.subheader("File Analysis")
-                create_file_analysis_table(results)
+                create_file_analysis_table(st.session_state.files_df)
                 
                 st.subheader("Top Issues")
                 issues = results.get('issues', [])
                 if issues:
-                    for i, issue in enumerate(issues[:10], 1):
+                    shown = st.session_state.issue_page * ISSUES_PAGE_SIZE
+                    for i, issue in enumerate(issues[:shown], 1):
                         severity_icon = {
                             'critical': '[CRITICAL]', 'high': '[HIGH]', 'medium': '[MEDIUM]', 'low': '[LOW]', 'info': '[INFO]'
                         }.get(issue.get('severity', 'info'), '[UNKNOWN]')
@@ -607,8 +789,15 @@ def analyze_page():
                             st.write(f"**Description:** {issue.get('description', 'No description available')}")
                             if issue.get('suggestion'):
                                 st.write(f"**Suggestion:** {issue.get('suggestion')}")
-                            if issue.get('code_snippet'):
+                            # Highlight snippets only on demand
+                            if issue.get('code_snippet') and st.checkbox("Show code", key=f"show_code_{i}"):
                                 st.code(issue.get('code_snippet'), language=issue.get('language', 'text'))
+                    
+                    if shown < len(issues):
+                        st.button(
+                            f"Load more ({len(issues) - shown} remaining)",
+                            on_click=load_more_issues
+                        )
                 else:
                     st.info("No issues found!")
             
@@ -635,8 +824,9 @@ def chat_page():
                 if 'error' in results:
                     st.error(f"Analysis failed: {results['error']}")
                 else:
-                    st.session_state.analysis_results = results
+                    set_analysis_results(results)
                     st.session_state.chatbot = None  # Reset chatbot
+                    st.session_state.last_ctx_hash = None
                     st.success("Analysis complete! You can now chat with your codebase.")
                     st.rerun()
         else:
@@ -661,7 +851,7 @@ def main():
     
     # Clear results button
     if st.sidebar.button("Clear All Results"):
-        st.session_state.analysis_results = None
+        set_analysis_results(None)
         st.session_state.chat_history = []
         st.rerun()
     
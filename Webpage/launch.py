@@ -3,22 +3,21 @@ Launcher script for Code Quality Intelligence Agent Web Interface.
 This script provides an easy way to launch the web application.
 """
 
-import subprocess
 import sys
 import os
+import importlib.util
 from pathlib import Path
 
+REQUIRED_MODULES = ("streamlit", "pandas", "plotly")
+
 def check_dependencies():
-    """Check if required dependencies are installed."""
-    try:
-        import streamlit
-        import pandas
-        import plotly
-        return True
-    except ImportError as e:
-        print(f"Missing dependency: {e}")
+    """Check if required dependencies are installed (without importing them)."""
+    missing = [name for name in REQUIRED_MODULES if importlib.util.find_spec(name) is None]
+    if missing:
+        print(f"Missing dependency: {', '.join(missing)}")
         print("Please install requirements: pip install -r requirements.txt")
         return False
+    return True
 
 def launch_app():
     """Launch the Streamlit application."""
@@ -33,13 +32,19 @@ def launch_app():
     print("⏹️  Press Ctrl+C to stop the server")
     print()
     
+    # Same options `streamlit run` would receive, in its flag_options form
+    flag_options = {
+        "server_address": "localhost",
+        "server_port": 8501,
+        "browser_gatherUsageStats": False
+    }
+    
     try:
-        subprocess.run([
-            sys.executable, "-m", "streamlit", "run", str(app_path),
-            "--server.address", "localhost",
-            "--server.port", "8501",
-            "--browser.gatherUsageStats", "false"
-        ])
+        # Serve in this process instead of spawning `python -m streamlit run`
+        from streamlit.web import bootstrap
+        
+        bootstrap.load_config_options(flag_options=flag_options)
+        bootstrap.run(str(app_path), False, [], flag_options)
     except KeyboardInterrupt:
         print("\n👋 Web interface stopped by user")
     except Exception as e:
@@ -6,46 +6,39 @@ This script performs basic tests to ensure the application works correctly.
 
 import sys
 import os
+import unittest
+from importlib.util import find_spec
 from pathlib import Path
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-def test_imports():
-    """Test if all required modules can be imported."""
-    print("Testing imports...")
+class ImportTests(unittest.TestCase):
+    """Check the web stack is installed without importing it at collection time."""
     
-    try:
-        import streamlit as st
-        print("✅ Streamlit imported successfully")
-    except ImportError as e:
-        print(f"❌ Streamlit import failed: {e}")
-        return False
+    def test_streamlit(self):
+        self.assertIsNotNone(find_spec("streamlit"), "Streamlit is not installed")
     
-    try:
-        import pandas as pd
-        print("✅ Pandas imported successfully")
-    except ImportError as e:
-        print(f"❌ Pandas import failed: {e}")
-        return False
+    def test_pandas(self):
+        self.assertIsNotNone(find_spec("pandas"), "Pandas is not installed")
     
-    try:
-        import plotly.express as px
-        print("✅ Plotly imported successfully")
-    except ImportError as e:
-        print(f"❌ Plotly import failed: {e}")
-        return False
+    def test_plotly(self):
+        self.assertIsNotNone(find_spec("plotly"), "Plotly is not installed")
     
-    try:
+    @unittest.skipUnless(find_spec("langchain_groq"), "LLM dependencies not installed")
+    def test_code_quality_agent(self):
         from code_quality_agent.agent import CodeQualityAgent
-        print("✅ CodeQualityAgent imported successfully")
-    except ImportError as e:
-        print(f"❌ CodeQualityAgent import failed: {e}")
-        return False
+        self.assertTrue(callable(CodeQualityAgent))
+
+def run_import_checks():
+    """Test if all required modules can be imported."""
+    print("Testing imports...")
     
-    return True
+    suite = unittest.defaultTestLoader.loadTestsFromTestCase(ImportTests)
+    result = unittest.TextTestRunner(stream=sys.stdout, verbosity=2).run(suite)
+    return result.wasSuccessful()
 
-def test_config():
+def run_config_check():
     """Test configuration loading."""
     print("\nTesting configuration...")
     
@@ -59,7 +52,7 @@ def test_config():
         print(f"❌ Configuration test failed: {e}")
         return False
 
-def test_app_structure():
+def run_structure_check():
     """Test if the app structure is correct."""
     print("\nTesting app structure...")
     
@@ -70,12 +63,21 @@ def test_app_structure():
         "requirements.txt", 
         "README.md",
         "launch.py",
-        "config.py"
+        "config.py",
+        "static/style.css"
     ]
     
+    # One listing per directory instead of a stat per required file
+    present = set()
+    for sub_dir in ("", "static"):
+        try:
+            with os.scandir(base_dir / sub_dir) as entries:
+                present.update(f"{sub_dir}/{entry.name}" if sub_dir else entry.name for entry in entries)
+        except FileNotFoundError:
+            pass
+    
     for file_name in required_files:
-        file_path = base_dir / file_name
-        if file_path.exists():
+        if file_name in present:
             print(f"✅ {file_name} exists")
         else:
             print(f"❌ {file_name} missing")
@@ -83,7 +85,7 @@ def test_app_structure():
     
     return True
 
-def test_launcher():
+def run_launcher_check():
     """Test the launcher script."""
     print("\nTesting launcher...")
     
@@ -105,19 +107,17 @@ def main():
     print("=" * 60)
     
     tests = [
-        test_imports,
-        test_config,
-        test_app_structure,
-        test_launcher
+        run_import_checks,
+        run_config_check,
+        run_structure_check,
+        run_launcher_check
     ]
     
-    passed = 0
     total = len(tests)
     
-    for test in tests:
-        if test():
-            passed += 1
-        print()
+    # Run in order: every check prints its own section
+    passed = sum(bool(test()) for test in tests)
+    print()
     
     print("=" * 60)
     print(f"Tests passed: {passed}/{total}")
@@ -5,10 +5,37 @@ An AI-powered code quality analysis tool that provides comprehensive insights
 into your codebase using advanced language models and static analysis techniques.
 """
 
-__version__ = "1.6.2"
+from importlib import import_module
+
 __author__ = "Code Quality Intelligence Team"
 
-from .agent import CodeQualityAgent
-from .config import Config
+# Used when running from a source checkout without installed metadata
+_SOURCE_VERSION = "1.6.2"
+
+__all__ = ["CodeQualityAgent", "Config"]
+
+_LAZY_EXPORTS = {
+    "CodeQualityAgent": "code_quality_agent.agent",
+    "Config": "code_quality_agent.config",
+}
+
+
+def __getattr__(name):
+    """Resolve the public exports on first access (PEP 562).
 
-__all__ = ["CodeQualityAgent", "Config"]
\ No newline at end of file
+    Importing ``agent`` pulls in the whole LLM stack, so plain
+    ``import code_quality_agent`` should not pay for it.
+    """
+    if name == "__version__":
+        from importlib.metadata import version, PackageNotFoundError
+        try:
+            value = version("code-quality-intelligence")
+        except PackageNotFoundError:
+            value = _SOURCE_VERSION
+        globals()["__version__"] = value
+        return value
+    if name in _LAZY_EXPORTS:
+        value = getattr(import_module(_LAZY_EXPORTS[name]), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -5,7 +5,19 @@ Entry point for running the Code Quality Intelligence Agent as a module.
 Usage: python -m code_quality_agent [commands]
 """
 
-from .cli import cli
+import sys
 
-if __name__ == '__main__':
+
+def main():
+    """Run the CLI, answering --version without importing it."""
+    if len(sys.argv) == 2 and sys.argv[1] in ("--version", "-V"):
+        from . import __version__
+        print(__version__)
+        sys.exit(0)
+    
+    from .cli import cli
     cli()
+
+
+if __name__ == '__main__':
+    main()
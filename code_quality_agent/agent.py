@@ -16,30 +16,56 @@ Functions/Classes:
   - `__init__(self)`: Initialize agent with Groq LLM, analyzers, and RAG system
   - `_setup_analysis_chain(self)`: Configure LLM chain for code analysis with structured prompts
   - `_setup_qa_chain(self)`: Configure interactive Q&A chain for user questions
-  - `async analyze_codebase(self, path, branch=None)`: Main analysis method that processes entire codebases
+  - `async analyze_codebase(self, path, branch=None, progress=None)`: Main analysis method that processes entire codebases
   - `async _analyze_file(self, file_path)`: Analyze individual files with LLM and static analyzers
-  - `async _analyze_large_file(self, file_path, content)`: Handle files larger than 1MB with chunking
+  - `async _file_response(self, content, language, filename)`: Get a file's LLM response through the response caches
+  - `_llm_slots(self)`: Semaphore bounding in-flight LLM requests across files and chunks
+  - `_response_key(self, language, content, chunk=False)`: Persistent raw-response cache key for code
+  - `_store_response(self, response_key, response)`: Persist a complete raw LLM response
+  - `_looks_generated(self, content)`: Detect generated or minified files that skip the LLM
+  - `async _analyze_large_file(self, file_path, content, language)`: Handle files larger than 1MB with chunking
   - `_create_code_chunks(self, content, language)`: Intelligently split code into meaningful chunks
-  - `_adjust_python_chunk_boundary(self, lines, start, end)`: Adjust chunk boundaries for Python code
-  - `_adjust_js_chunk_boundary(self, lines, start, end)`: Adjust chunk boundaries for JavaScript code
+  - `_adjust_python_chunk_boundary(self, top_level, start, end)`: Adjust chunk boundaries for Python code
+  - `_adjust_js_chunk_boundary(self, block_end, start, end)`: Adjust chunk boundaries for JavaScript code
+  - `async _bounded_stream(self, inputs)`: Stream one chunk analysis under the shared LLM request limit
+  - `async _collect_stream(self, stream)`: Accumulate a streamed LLM response into one string
+  - `async _chunk_response(self, digest, inputs)`: Fetch a chunk's LLM response through the process-wide LRU cache
   - `async _analyze_chunk(self, chunk, language, file_path, chunk_id)`: Analyze individual code chunks
   - `async _merge_chunk_results(self, chunk_results, file_path, language)`: Merge results from multiple chunks
   - `_generate_recommendations(self, issues)`: Generate high-level improvement recommendations
   - `async ask_question(self, question, analysis_context)`: Answer questions about analyzed code
   - `_offline_answer(self, question, ctx)`: Provide answers without LLM using heuristics
+- `normalize_severity(value, default="info")`: Canonical severity label and numeric rank
+- `severity_key(issue)`: Severity sort key for issue dicts
+- `line_start_offsets(content)`: Character offsets of line starts for slicing content
+- `line_mask(content, line_starts, pattern)`: Boolean mask of lines matching a regex
+- `focus_excerpt(content, line_starts, flagged_lines, before=10, after=40)`: Excerpt of content around flagged lines, with a line map
+- `extract_chunk_fields(response)`: Parse an LLM chunk response into issues, metrics and summary (None if unusable)
+- `loose_json_array(text)`: Parse a JSON array from a fenced or prose-wrapped LLM response
+- `clean_recommendations(parsed)`: Normalize LLM recommendation objects to bounded string fields
+- `json_bounded(items, limit)`: Encode an iterable's prefix as JSON within a size budget
   
 """
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Callable, Tuple, Iterable, Mapping
 from pathlib import Path
-import json
+import asyncio
+import hashlib
+import heapq
 import logging
+import re
+import threading
+from collections import Counter, OrderedDict, defaultdict
+from itertools import chain
+from operator import itemgetter
+from types import MappingProxyType
+
+import numpy as np
 
 from langchain_groq import ChatGroq
 from langchain.schema import HumanMessage, SystemMessage
 from langchain.prompts import PromptTemplate
 from langchain.chains import LLMChain
-from langchain.memory import ConversationBufferMemory
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.output_parsers import StrOutputParser
 
@@ -49,6 +75,305 @@ from .report_generator import ReportGenerator
 from .rag_system import CodeRAGSystem
 from .chatbot import CodeQualityChatbot
 from .utils.file_handler import FileHandler
+from .utils.analysis_cache import AnalysisCache
+from .utils.semantic_cache import SemanticCache
+from .utils import json_codec
+
+
+# Per-file metrics averaged into the codebase summary
+OVERALL_METRICS = ("complexity_score", "maintainability_score", "security_score", "overall_score")
+
+# Issue-based score weights
+SEVERITY_PENALTY_WEIGHTS = {"critical": 25, "high": 15, "medium": 8, "low": 3, "info": 1}
+CATEGORY_PENALTY_WEIGHTS = {
+    "security": 20,
+    "complexity": 10,
+    "maintainability": 5,
+    "best_practices": 3,
+    "code_duplication": 2,
+    "testing": 5,
+    "documentation": 2
+}
+# Which score each category's penalty also counts against (1: security, 2: maintainability)
+PENALTY_BUCKETS = {
+    "security": 1,
+    "maintainability": 2,
+    "complexity": 2,
+    "best_practices": 2,
+    "code_duplication": 2,
+    "documentation": 2
+}
+
+# (field, value, count threshold, message) rules for _generate_recommendations
+RECOMMENDATION_RULES = (
+    ("severity", "critical", 0, "🚨 Address critical security and performance issues immediately"),
+    ("category", "security", 3, "🔒 Consider implementing a security review process"),
+    ("category", "complexity", 5, "🧩 Refactor complex functions to improve maintainability"),
+    ("category", "testing", 3, "🧪 Increase test coverage for better code reliability"),
+    ("category", "documentation", 3, "📚 Improve code documentation and comments")
+)
+
+# Question keywords routing offline answers to an issue category, one regex per bucket
+OFFLINE_QUESTION_BUCKETS = tuple(
+    (category, re.compile("|".join(map(re.escape, keywords))))
+    for category, keywords in (
+        ("security", ("security", "xss", "sql", "injection", "secret", "auth", "crypto")),
+        ("performance", ("performance", "slow", "latency", "memory", "optimize")),
+        ("complexity", ("complexity", "refactor", "maintainability")),
+        ("testing", ("test", "coverage")),
+        ("documentation", ("doc", "comment"))
+    )
+)
+
+# Chat prompts for the analysis and Q&A runnables, parsed once per process
+ANALYSIS_PROMPT = ChatPromptTemplate.from_messages([
+    ("system", "You are an expert code quality analyst. Return STRICT JSON only, no prose."),
+    ("human",
+     "Analyze the following {language} code from file {filename} and identify quality issues.\n\n"
+     "Focus on: security, performance, complexity, duplication, testing, documentation, maintainability, best_practices.\n\n"
+     "Code to analyze:\n```{language}\n{code}\n```\n\n"
+     "Respond with a JSON object with keys: issues (array of objects: category, severity, line_number, title, description, suggestion, code_snippet), metrics (object with complexity_score, maintainability_score, security_score, overall_score), summary (string), "
+     "recommendations (array of up to 3 objects with keys: title, rationale, fix_snippet, each a concrete fix with a minimal code snippet). Do not include any text outside JSON.")
+])
+# Large-file chunks skip recommendations: the merge step asks for them once per file
+CHUNK_ANALYSIS_PROMPT = ChatPromptTemplate.from_messages([
+    ("system", "You are an expert code quality analyst. Return STRICT JSON only, no prose."),
+    ("human",
+     "Analyze the following {language} code from file {filename} and identify quality issues.\n\n"
+     "Focus on: security, performance, complexity, duplication, testing, documentation, maintainability, best_practices.\n\n"
+     "Code to analyze:\n```{language}\n{code}\n```\n\n"
+     "Respond with a JSON object with keys: issues (array of objects: category, severity, line_number, title, description, suggestion, code_snippet), metrics (object with complexity_score, maintainability_score, security_score, overall_score), summary (string). "
+     "Do not include any text outside JSON.")
+])
+QA_PROMPT = ChatPromptTemplate.from_messages([
+    ("system", "You are a helpful code quality assistant."),
+    ("human",
+     "Analysis Context (JSON):\n{context}\n\n"
+     "User Question: {question}\n\n"
+     "Provide a concise, actionable answer referencing findings.")
+])
+
+# Bump when the analysis prompts change, so cached analyses and LLM responses
+# produced for the old wording are not reused
+PROMPT_VERSION = 1
+
+# Prompt scaffolds for the recommendation and merge LLM calls
+OVERALL_RECOMMENDATIONS_PROMPT = (
+    "Given the following list of issues across a codebase, provide 5 concise, actionable "
+    "recommendations to improve security, performance, maintainability, and testing. "
+    "Return STRICT JSON array of strings. Issues: "
+)
+FILE_RECOMMENDATIONS_PROMPT = (
+    "You are a senior {language} code reviewer. Based on the merged issues, "
+    "generate up to 3 concrete recommendations each with a minimal fix snippet. "
+    "Return STRICT JSON array of objects with keys: title, rationale, fix_snippet.\n\n"
+    "File: {filename}\nIssues: {issues}"
+)
+MERGE_SUMMARY_PROMPT = """
+Analyze the following chunk summaries from a large {language} file ({filename}) and provide a comprehensive summary of the overall code quality:
+
+Chunk Summaries:
+{summaries}
+
+Total Issues Found: {issue_count}
+
+Provide a concise overall summary highlighting the main quality concerns and patterns across all chunks.
+"""
+
+# (field, default, max length) kept from each LLM recommendation object
+RECOMMENDATION_FIELDS = (
+    ("title", "Recommendation", 200),
+    ("rationale", "", 1000),
+    ("fix_snippet", "", 4000)
+)
+
+# JSON array inside a markdown code fence
+FENCED_JSON_ARRAY = re.compile(r'```(?:json)?\s*(\[.*?\])\s*```', re.S)
+
+# Per-issue code snippet length sent in merge prompts
+PROMPT_SNIPPET_CHARS = 256
+
+# Chunk summaries at or under these sizes are concatenated instead of LLM-merged
+MERGE_SUMMARY_MAX_CHUNKS = 2
+MERGE_SUMMARY_MAX_CHARS = 800
+
+# LLM responses longer than this are parsed off the event loop
+OFFLOOP_PARSE_CHARS = 64000
+
+# Shared read-only fallback for missing per-chunk dicts
+EMPTY_MAPPING: Mapping[str, Any] = MappingProxyType({})
+
+# Chunk digest -> raw LLM response, shared by every agent in the process (LRU of
+# Config.CHUNK_CACHE_SIZE entries). The web UI builds a new agent per run, on its
+# own thread and event loop, so access is serialized with a lock.
+_CHUNK_RESPONSES: "OrderedDict[str, str]" = OrderedDict()
+_CHUNK_RESPONSES_LOCK = threading.Lock()
+
+# Markers of machine-generated files, matched only in the leading comment lines
+# of the first 2KB (e.g. "// Code generated by protoc-gen-go. DO NOT EDIT.")
+GENERATED_MARKER = re.compile(r'@generated\b|\bDO NOT EDIT\b')
+HEADER_COMMENT_LINE = re.compile(r'[^\S\n]*(?:#|//|/\*|\*|<!--|--|;)')
+
+# Chunk boundary candidates: lines starting at column 0 (Python), and
+# non-comment lines ending with a closing brace (JavaScript/TypeScript)
+PY_TOP_LEVEL_LINE = re.compile(r'^\S', re.M)
+JS_BLOCK_END_LINE = re.compile(r'^(?![^\S\n]*//).*\}[^\S\n]*$', re.M)
+
+# Static analyzer result groups: (results key, issue category, default severity)
+STATIC_ISSUE_GROUPS = (
+    ("security_issues", "security", "medium"),
+    ("complexity_issues", "complexity", "medium"),
+    ("style_issues", "maintainability", "low"),
+    ("pattern_issues", "best_practices", "low"),
+)
+
+# Static finding categories whose regions are kept when excerpting big files for the LLM
+FOCUS_CATEGORIES = frozenset({"security", "complexity"})
+
+
+def normalize_severity(value: Any, default: str = "info") -> Tuple[str, int]:
+    """Lowercase a severity label and pair it with its rank (unknown labels rank 0)."""
+    severity = str(value).lower() if value else default
+    return severity, Config.SEVERITY_LEVELS.get(severity, 0)
+
+
+def severity_key(issue: Dict[str, Any]) -> int:
+    """Sort key ranking an issue by severity, using its precomputed rank when present."""
+    rank = issue.get("severity_rank")
+    if rank is None:
+        rank = Config.SEVERITY_LEVELS.get(issue.get("severity", "info"), 0)
+    return rank
+
+
+def line_start_offsets(content: str) -> np.ndarray:
+    """Offset of each line's first character in content, plus one past the end.
+
+    Newlines are found with one vectorized scan over the code points, so the
+    content is never split into per-line strings.
+    """
+    codepoints = np.frombuffer(content.encode('utf-32-le', errors='surrogatepass'), dtype=np.uint32)
+    newlines = np.flatnonzero(codepoints == 10)
+    starts = np.empty(len(newlines) + 2, dtype=np.int64)
+    starts[0] = 0
+    starts[1:-1] = newlines + 1
+    starts[-1] = len(content) + 1
+    return starts
+
+
+def line_mask(content: str, line_starts: np.ndarray, pattern: re.Pattern) -> np.ndarray:
+    """Mark the lines of content where a MULTILINE pattern match begins."""
+    mask = np.zeros(len(line_starts) - 1, dtype=bool)
+    positions = np.fromiter((m.start() for m in pattern.finditer(content)), dtype=np.int64)
+    mask[np.searchsorted(line_starts, positions, side='right') - 1] = True
+    return mask
+
+
+def focus_excerpt(content: str, line_starts: np.ndarray, flagged_lines: List[int],
+                  before: int = 10, after: int = 40) -> Tuple[str, np.ndarray]:
+    """Cut content down to windows around flagged (1-based) lines.
+
+    Overlapping windows are merged and separated by a ``...`` line. Returns the
+    excerpt and, for each of its lines, the original 1-based line number (a
+    separator maps to the first line of the window after it).
+    """
+    num_lines = len(line_starts) - 1
+    centers = np.unique(np.asarray(flagged_lines, dtype=np.int64)) - 1
+    starts = np.clip(centers - before, 0, num_lines)
+    ends = np.clip(centers + after, 0, num_lines)
+    # Merge windows that overlap or touch
+    windows: List[List[int]] = []
+    for start, end in zip(starts.tolist(), ends.tolist()):
+        if windows and start <= windows[-1][1]:
+            windows[-1][1] = max(windows[-1][1], end)
+        elif end > start:
+            windows.append([start, end])
+    
+    pieces: List[str] = []
+    line_map: List[np.ndarray] = []
+    for start, end in windows:
+        if pieces:
+            pieces.append("...")
+            line_map.append(np.array([start + 1], dtype=np.int64))
+        pieces.append(content[line_starts[start]:line_starts[end] - 1])
+        line_map.append(np.arange(start + 1, end + 1, dtype=np.int64))
+    if not pieces:
+        return content, np.arange(1, num_lines + 1, dtype=np.int64)
+    return "\n".join(pieces), np.concatenate(line_map)
+
+
+def extract_chunk_fields(response: str) -> Optional[Dict[str, Any]]:
+    """Parse an LLM chunk response down to its issues, metrics and summary.
+
+    Returns None when the response is not a JSON object.
+    """
+    parsed = None
+    # Only a JSON object is usable; skip parsing truncated or prose responses
+    if response.rstrip()[-1:] == "}":
+        try:
+            parsed = json_codec.loads(response)
+        except Exception:
+            parsed = None
+    if not isinstance(parsed, dict):
+        return None
+    issues = parsed.get("issues")
+    metrics = parsed.get("metrics")
+    summary = parsed.get("summary")
+    return {
+        "issues": [i for i in issues if isinstance(i, dict)] if isinstance(issues, list) else [],
+        "metrics": metrics if isinstance(metrics, dict) else {},
+        "summary": summary if isinstance(summary, str) else ""
+    }
+
+
+def loose_json_array(text: str) -> Any:
+    """Parse a JSON array from an LLM response that may wrap it in fences or prose.
+
+    Returns the parsed value, or None when no parsable array is found.
+    """
+    try:
+        return json_codec.loads(text)
+    except ValueError:
+        pass
+    fenced = FENCED_JSON_ARRAY.search(text)
+    if fenced:
+        candidate = fenced.group(1)
+    else:
+        start, end = text.find('['), text.rfind(']')
+        if start == -1 or end < start:
+            return None
+        candidate = text[start:end + 1]
+    try:
+        return json_codec.loads(candidate)
+    except ValueError:
+        return None
+
+
+def clean_recommendations(parsed: Any) -> List[Dict[str, str]]:
+    """Normalize up to three LLM recommendation objects to bounded string fields."""
+    if not isinstance(parsed, list):
+        return []
+    return [
+        {field: str(rec.get(field, default))[:limit] for field, default, limit in RECOMMENDATION_FIELDS}
+        for rec in parsed[:3]
+        if isinstance(rec, dict)
+    ]
+
+
+def json_bounded(items: Iterable[Any], limit: int) -> str:
+    """Encode the leading items of an iterable as a JSON array of at most ``limit`` chars.
+
+    Stops consuming and encoding once the budget is spent, so large issue lists are
+    never serialized in full just to be truncated, and the result stays valid JSON.
+    """
+    parts: List[str] = []
+    size = 2  # the enclosing brackets
+    for item in items:
+        encoded = json_codec.dumps(item)
+        size += len(encoded) + (2 if parts else 0)
+        if size > limit:
+            break
+        parts.append(encoded)
+    return "[" + ", ".join(parts) + "]"
 
 
 class CodeQualityAgent:
@@ -67,11 +392,35 @@ class CodeQualityAgent:
                 max_tokens=Config.MAX_TOKENS
             )
         
-        self.memory = ConversationBufferMemory(return_messages=True)
         self.analyzer = CodeAnalyzer()
+        # Chunk requests still in flight (futures belong to this agent's event loop)
+        self._chunk_pending: Dict[str, "asyncio.Future[str]"] = {}
+        # Shared bound on in-flight LLM requests (see _llm_slots)
+        self._llm_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._llm_semaphore: Optional[asyncio.Semaphore] = None
         self.report_generator = ReportGenerator()
         self.file_handler = FileHandler()
         
+        # Persistent per-file results, keyed by content hash
+        self.analysis_cache = None
+        if Config.ENABLE_CACHE:
+            try:
+                self.analysis_cache = AnalysisCache(Config.CACHE_DB, Config.CACHE_MAX_ENTRIES)
+            except Exception as e:
+                logging.warning(f"Analysis cache unavailable: {e}")
+        
+        # In-memory reuse of LLM responses for near-identical files
+        self.semantic_cache = None
+        if Config.SEMANTIC_CACHE:
+            semantic_cache = SemanticCache(
+                threshold=Config.SEMANTIC_CACHE_THRESHOLD,
+                max_entries=Config.SEMANTIC_CACHE_SIZE
+            )
+            if semantic_cache.is_available():
+                self.semantic_cache = semantic_cache
+            else:
+                logging.warning("Semantic cache requested but sentence-transformers is not installed")
+        
         # Initialize enhanced features
         self.rag_system = CodeRAGSystem()
         self.chatbot = CodeQualityChatbot(self.rag_system)
@@ -82,124 +431,134 @@ class CodeQualityAgent:
     
     def _setup_analysis_chain(self):
         """Setup the code analysis chain."""
-        analysis_prompt = ChatPromptTemplate.from_messages([
-            ("system", "You are an expert code quality analyst. Return STRICT JSON only, no prose."),
-            ("human",
-             "Analyze the following {language} code from file {filename} and identify quality issues.\n\n"
-             "Focus on: security, performance, complexity, duplication, testing, documentation, maintainability, best_practices.\n\n"
-             "Code to analyze:\n```{language}\n{code}\n```\n\n"
-             "Respond with a JSON object with keys: issues (array of objects: category, severity, line_number, title, description, suggestion, code_snippet), metrics (object with complexity_score, maintainability_score, security_score, overall_score), summary (string). Do not include any text outside JSON.")
-        ])
-
         if self.llm:
-            self.analysis_runnable = analysis_prompt | self.llm | StrOutputParser()
+            self.analysis_runnable = ANALYSIS_PROMPT | self.llm | StrOutputParser()
+            self.chunk_runnable = CHUNK_ANALYSIS_PROMPT | self.llm | StrOutputParser()
         else:
             self.analysis_runnable = None
+            self.chunk_runnable = None
     
     def _setup_qa_chain(self):
         """Setup the interactive Q&A chain."""
-        qa_prompt = ChatPromptTemplate.from_messages([
-            ("system", "You are a helpful code quality assistant."),
-            ("human", 
-             "Analysis Context (JSON):\n{context}\n\n"
-             "User Question: {question}\n\n"
-             "Provide a concise, actionable answer referencing findings.")
-        ])
-
         if self.llm:
-            self.qa_runnable = qa_prompt | self.llm | StrOutputParser()
+            self.qa_runnable = QA_PROMPT | self.llm | StrOutputParser()
         else:
             self.qa_runnable = None
     
-    async def analyze_codebase(self, path: str, branch: Optional[str] = None) -> Dict[str, Any]:
-        """Analyze a codebase and return comprehensive results."""
+    async def analyze_codebase(self, path: str, branch: Optional[str] = None,
+                               progress: Optional[Callable[[str], None]] = None) -> Dict[str, Any]:
+        """Analyze a codebase and return comprehensive results.
+
+        ``progress`` is called with a short label as each phase starts.
+        """
+        report = progress or (lambda phase: None)
         try:
             # Handle file/directory input with optional branch
+            report("Collecting files")
             files = self.file_handler.get_code_files(path, branch=branch)
             
             if not files:
                 return {"error": "No supported code files found"}
             
             all_issues = []
+            issue_ranks: List[int] = []  # severity rank column, parallel to all_issues
             file_analyses = {}
-            duplication_index = {}
-            overall_metrics = {
-                "complexity_score": 0,
-                "maintainability_score": 0, 
-                "security_score": 0,
-                "overall_score": 0
-            }
+            # Duplication fingerprints as parallel columns (one row per fingerprint)
+            hash_ids: Dict[str, int] = {}
+            dup_hash: List[int] = []
+            dup_file: List[int] = []
+            dup_start: List[int] = []
+            dup_line: List[Any] = []
+            file_names: List[str] = []
+            metric_rows = []
             
-            # Analyze each file
-            for file_path in files:
-                file_analysis = await self._analyze_file(file_path)
+            # Analyze files concurrently; the LLM round trips dominate and are independent
+            semaphore = asyncio.Semaphore(Config.MAX_CONCURRENCY)
+            completed = 0
+
+            async def _one(file_path: Path):
+                nonlocal completed
+                async with semaphore:
+                    file_analysis = await self._analyze_file(file_path)
+                completed += 1
+                report(f"Analyzed {file_path.name} ({completed}/{len(files)})")
+                return file_analysis
+
+            report(f"Analyzing {len(files)} files")
+            analyses = await asyncio.gather(*[_one(fp) for fp in files], return_exceptions=True)
+
+            for file_path, file_analysis in zip(files, analyses):
+                if isinstance(file_analysis, BaseException):
+                    file_analysis = {"error": f"Failed to analyze {file_path}: {str(file_analysis)}"}
                 file_analyses[str(file_path)] = file_analysis
                 
                 if "issues" in file_analysis:
                     all_issues.extend(file_analysis["issues"])
+                    issue_ranks.extend(map(itemgetter("severity_rank"), file_analysis["issues"]))
 
                 # Collect duplication fingerprints
+                file_id = len(file_names)
+                file_names.append(str(file_path))
                 for fp in (file_analysis.get("duplication_fingerprints") or []):
                     h = fp.get("hash")
                     if not h:
                         continue
-                    duplication_index.setdefault(h, []).append({
-                        "file_path": str(file_path),
-                        "start_line": fp.get("start_line"),
-                        "end_line": fp.get("end_line"),
-                        "size": fp.get("size", 0)
-                    })
+                    dup_hash.append(hash_ids.setdefault(h, len(hash_ids)))
+                    dup_file.append(file_id)
+                    dup_start.append(fp.get("start_line") or 0)
+                    dup_line.append(fp.get("start_line"))
                 
-                # Aggregate metrics
+                # Collect metrics for aggregation
                 if "metrics" in file_analysis:
-                    for metric, value in file_analysis["metrics"].items():
-                        if metric in overall_metrics:
-                            overall_metrics[metric] += value
+                    file_metrics = file_analysis["metrics"]
+                    metric_rows.append([file_metrics.get(m, 0) for m in OVERALL_METRICS])
             
-            # Calculate average metrics
-            num_files = len(files)
-            if num_files > 0:
-                for metric in overall_metrics:
-                    overall_metrics[metric] = round(overall_metrics[metric] / num_files, 2)
+            # Calculate average metrics (files without metrics count as zero)
+            totals = np.array(metric_rows, dtype=np.float64).reshape(-1, len(OVERALL_METRICS)).sum(axis=0)
+            overall_metrics = {
+                metric: round(float(total) / len(files), 2)
+                for metric, total in zip(OVERALL_METRICS, totals)
+            }
             
             # Emit duplication issues for repeated hashes found in multiple files/locations
-            for h, occs in duplication_index.items():
-                if len(occs) <= 1:
-                    continue
-                # Group occurrences by file and suppress adjacent windows (sliding dedupe)
-                file_to_occs: Dict[str, list] = {}
-                for occ in sorted(occs, key=lambda o: (o.get("file_path", ""), o.get("start_line", 0))):
-                    file_to_occs.setdefault(occ["file_path"], []).append(occ)
-
-                for file_path, flist in file_to_occs.items():
-                    compacted = []
-                    prev_end = -1
-                    for o in flist:
-                        # Skip windows that overlap/are adjacent to previous to avoid flooding
-                        if prev_end >= 0 and o.get("start_line", 0) <= prev_end + 1:
-                            prev_end = max(prev_end, o.get("end_line", 0))
-                            continue
-                        compacted.append(o)
-                        prev_end = o.get("end_line", 0)
-
-                    # Emit at most one issue per file per duplicate hash
-                    if compacted:
-                        first = compacted[0]
-                        all_issues.append({
-                            "category": "code_duplication",
-                            "severity": "low",
-                            "line_number": first.get("start_line", 0),
-                            "title": "Duplicate code block detected",
-                            "description": f"This block appears {len(occs)} times across the codebase.",
-                            "suggestion": "Extract common logic into a reusable function/module to reduce duplication.",
-                            "code_snippet": "",
-                            "file_path": file_path
-                        })
+            report("Detecting duplicate code")
+            if dup_hash:
+                hash_col = np.asarray(dup_hash, dtype=np.int64)
+                occurrences = np.bincount(hash_col)
+                # Files ranked by path so each hash's issues come out in path order
+                file_rank = np.argsort(np.argsort(np.asarray(file_names), kind="stable"), kind="stable")
+                rank_col = file_rank[np.asarray(dup_file, dtype=np.int64)]
+                start_col = np.asarray(dup_start, dtype=np.int64)
+                # Hashes in first-seen order, then file path, then earliest window
+                # (ties keep collection order); only repeated hashes qualify
+                order = np.lexsort((np.arange(len(dup_hash)), start_col, rank_col, hash_col))
+                order = order[occurrences[hash_col[order]] > 1]
+                # Only the earliest window per file is reported (one issue per file per hash)
+                group_start = np.ones(len(order), dtype=bool)
+                group_start[1:] = (np.diff(hash_col[order]) != 0) | (np.diff(rank_col[order]) != 0)
+                
+                low_rank = Config.SEVERITY_LEVELS["low"]
+                for row in order[group_start].tolist():
+                    issue_ranks.append(low_rank)
+                    all_issues.append({
+                        "category": "code_duplication",
+                        "severity": "low",
+                        "line_number": dup_line[row],
+                        "title": "Duplicate code block detected",
+                        "description": f"This block appears {occurrences[dup_hash[row]]} times across the codebase.",
+                        "suggestion": "Extract common logic into a reusable function/module to reduce duplication.",
+                        "code_snippet": "",
+                        "file_path": file_names[dup_file[row]],
+                        "severity_rank": low_rank
+                    })
 
-            # Sort issues by severity
-            all_issues.sort(key=lambda x: Config.SEVERITY_LEVELS.get(x.get("severity", "info"), 0), reverse=True)
+            # Sort issues by severity: a stable argsort over the rank column, then
+            # materialize the dict list once in that order
+            order = np.argsort(-np.asarray(issue_ranks, dtype=np.int8), kind="stable")
+            all_issues = [all_issues[i] for i in order]
             
             # Build overall recommendations from per-file recs; ensure non-empty
+            report("Generating recommendations")
             overall_recommendations: List[str] = []
             for fa in file_analyses.values():
                 if isinstance(fa, dict):
@@ -210,14 +569,10 @@ class CodeQualityAgent:
             if self.llm and not overall_recommendations:
                 try:
                     # Ask LLM for overall recommendations based on issues
-                    issues_json = json.dumps(all_issues)[:50000]
-                    prompt = (
-                        "Given the following list of issues across a codebase, provide 5 concise, actionable "
-                        "recommendations to improve security, performance, maintainability, and testing. "
-                        "Return STRICT JSON array of strings. Issues: " + issues_json
-                    )
+                    issues_json = json_bounded(all_issues, 50000)
+                    prompt = OVERALL_RECOMMENDATIONS_PROMPT + issues_json
                     resp = await self.llm.ainvoke([HumanMessage(content=prompt)])
-                    parsed = json.loads(resp.content)
+                    parsed = loose_json_array(resp.content)
                     if isinstance(parsed, list):
                         overall_recommendations = [str(x) for x in parsed if str(x).strip()][:5]
                 except Exception:
@@ -241,6 +596,7 @@ class CodeQualityAgent:
             
             # Add to RAG system for enhanced Q&A
             if self.rag_system.is_available():
+                report("Indexing codebase for Q&A")
                 try:
                     self.rag_system.add_codebase(files, results)
                     self.chatbot.set_analysis_context(results)
@@ -255,53 +611,85 @@ class CodeQualityAgent:
     async def _analyze_file(self, file_path: Path) -> Dict[str, Any]:
         """Analyze a single file."""
         try:
-            content = file_path.read_text(encoding='utf-8', errors='ignore')
+            # Read off the event loop so disk I/O overlaps other files' LLM calls
+            loop = asyncio.get_running_loop()
+            raw = await loop.run_in_executor(None, file_path.read_bytes)
+            content = raw.decode('utf-8', errors='ignore')
+            
+            # Unchanged files reuse their previous analysis
+            cache_key = None
+            if self.analysis_cache:
+                cache_key = AnalysisCache.make_key(
+                    file_path, content, Config.DEFAULT_MODEL, self.analyzer.cache_tag, PROMPT_VERSION
+                )
+                cached = self.analysis_cache.get(cache_key)
+                if cached is not None:
+                    return cached
             
             language = self.file_handler.detect_language(file_path)
             
-            # Run static analyzers first (always, even for large files)
+            # Run static analyzers first (always, even for large files); they are
+            # CPU/subprocess bound, so run them in a worker to keep other files' LLM I/O flowing
             static_results: Dict[str, Any] = {}
+            static_call: Optional[Tuple[Callable[..., Dict[str, Any]], tuple]] = None
             if language in ["python"]:
-                static_results = self.analyzer.analyze_python_file(file_path)
+                static_call = (self.analyzer.analyze_python_file, (file_path,))
             elif language in ["javascript", "typescript"]:
-                static_results = self.analyzer.analyze_javascript_file(file_path)
+                static_call = (self.analyzer.analyze_javascript_file, (file_path,))
             elif language == "jupyter":
-                static_results = self.analyzer.analyze_jupyter_file(file_path)
+                static_call = (self.analyzer.analyze_jupyter_file, (file_path,))
             elif language in [
                 "java", "cpp", "c", "csharp", "go", "rust", "php", "ruby",
                 "swift", "kotlin", "scala"
             ]:
-                static_results = self.analyzer.analyze_generic_file(file_path, language)
+                static_call = (self.analyzer.analyze_generic_file, (file_path, language))
+            if static_call:
+                # Static results depend only on content, language and analyzer setup
+                static_key = None
+                cached_static = None
+                if self.analysis_cache:
+                    static_key = AnalysisCache.make_static_key(language, content, self.analyzer.cache_tag)
+                    cached_static = self.analysis_cache.get(static_key)
+                if cached_static is not None:
+                    static_results = cached_static
+                else:
+                    analyze, args = static_call
+                    static_results = await loop.run_in_executor(None, analyze, *args)
+                    if static_key and not static_results.get("analysis_error"):
+                        self.analysis_cache.put(static_key, static_results)
+
+            # Index line starts once; every snippet below is a single slice of content
+            line_starts = line_start_offsets(content)
+            num_lines = len(line_starts) - 1
 
             # Prepare static mapped issues (ensure code_snippet present)
-            def _ensure_code_snippet(src: str, ln: int, snippet: str) -> str:
+            def _ensure_code_snippet(ln: int, snippet: str) -> str:
                 if snippet:
                     return snippet
-                lines = src.split('\n')
                 start = max(0, (ln - 1) - 4) if ln > 0 else 0
-                end = min(len(lines), (ln - 1) + 4) if ln > 0 else min(len(lines), 8)
-                return "\n".join(lines[start:end])
+                end = min(num_lines, (ln - 1) + 4) if ln > 0 else min(num_lines, 8)
+                if end <= start:
+                    return ""
+                return content[line_starts[start]:line_starts[end] - 1]
 
+            # Map every analyzer group in one pass over the tagged findings
+            file_path_str = str(file_path)
             static_mapped: List[Dict[str, Any]] = []
-            def map_group(items: list, category: str, default_severity: str = "medium"):
-                for it in items or []:
+            for key, category, default_severity in STATIC_ISSUE_GROUPS:
+                for it in static_results.get(key) or []:
                     ln = it.get("line", 0)
-                    snippet = _ensure_code_snippet(content, ln, it.get("code", ""))
+                    severity, rank = normalize_severity(it.get("severity"), default_severity)
                     static_mapped.append({
                         "category": category,
-                        "severity": it.get("severity", default_severity),
+                        "severity": severity,
                         "line_number": ln,
                         "title": it.get("type", category),
                         "description": it.get("message", it.get("rule_id", "Static analysis finding")),
-                        "code_snippet": snippet,
-                        "file_path": str(file_path)
+                        "code_snippet": _ensure_code_snippet(ln, it.get("code", "")),
+                        "file_path": file_path_str,
+                        "severity_rank": rank
                     })
 
-            map_group(static_results.get("security_issues", []), "security")
-            map_group(static_results.get("complexity_issues", []), "complexity")
-            map_group(static_results.get("style_issues", []), "maintainability", "low")
-            map_group(static_results.get("pattern_issues", []), "best_practices", "low")
-
             # Heuristic fix snippet generator for common patterns
             def _heuristic_fixes(issues: List[Dict[str, Any]], lang: str) -> List[Dict[str, str]]:
                 fixes: List[Dict[str, str]] = []
@@ -347,41 +735,71 @@ class CodeQualityAgent:
             # Handle large files with chunking for LLM
             is_large = len(content) > Config.MAX_FILE_SIZE
             llm_chunk_result: Optional[Dict[str, Any]] = None
+            llm_analysis: Dict[str, Any] = {}
             if is_large:
-                llm_chunk_result = await self._analyze_large_file(file_path, content)
-                response = json.dumps({
+                llm_chunk_result = await self._analyze_large_file(file_path, content, language)
+                # Don't persist a result missing any chunk's analysis
+                if "error" in llm_chunk_result or llm_chunk_result.get("failed_chunks"):
+                    cache_key = None
+                # Already structured; no need to round-trip through JSON text
+                llm_analysis = {
                     "issues": llm_chunk_result.get("issues", []),
                     "metrics": llm_chunk_result.get("metrics", {}),
-                    "summary": llm_chunk_result.get("summary", "")
-                })
+                    "summary": llm_chunk_result.get("summary", ""),
+                    "recommendations": llm_chunk_result.get("recommendations", [])
+                }
             else:
-                # Run LLM analysis (always attempt) and recommendations per file
+                # Run LLM analysis (always attempt); recommendations come back in the same response
                 response = "{}"
-                if self.analysis_runnable:
+                # Empty/trivial and machine-generated files aren't worth an LLM round trip;
+                # static analysis above still covers them
+                generated = self._looks_generated(content)
+                if generated:
+                    logging.info(f"Skipping LLM analysis of generated file: {file_path}")
+                skip_llm = generated or len(content.strip()) < Config.MIN_LLM_BYTES
+                # Big files with static findings send only the flagged regions;
+                # line_map translates the LLM's excerpt line numbers back
+                llm_content, line_map = content, None
+                if len(content) >= Config.LLM_FOCUS_MIN_BYTES:
+                    flagged = [
+                        it["line_number"] for it in static_mapped
+                        if it["category"] in FOCUS_CATEGORIES and isinstance(it["line_number"], int)
+                        and it["line_number"] > 0
+                    ]
+                    if flagged:
+                        llm_content, line_map = focus_excerpt(content, line_starts, flagged)
+                if self.analysis_runnable and not skip_llm:
                     try:
-                        response = await self.analysis_runnable.ainvoke({
-                            "code": content,
-                            "language": language,
-                            "filename": file_path.name
-                        })
+                        response, borrowed = await self._file_response(llm_content, language, file_path.name)
+                        # A response borrowed from a similar file is never persisted as this file's analysis
+                        if borrowed:
+                            cache_key = None
                     except Exception:
                         response = "{}"
+                        # Don't persist a result the LLM never saw
+                        cache_key = None
 
-            # Parse JSON response (LLM)
-            llm_analysis: Dict[str, Any] = {}
-            try:
-                llm_analysis = json.loads(response)
-            except Exception:
-                llm_analysis = {"issues": [], "metrics": {}, "summary": ""}
+                # Parse JSON response (LLM)
+                try:
+                    llm_analysis = json_codec.loads(response)
+                except Exception:
+                    llm_analysis = {"issues": [], "metrics": {}, "summary": ""}
+                    cache_key = None
+                if line_map is not None:
+                    for issue in llm_analysis.get("issues", []) or []:
+                        ln = issue.get("line_number")
+                        if isinstance(ln, int) and 1 <= ln <= len(line_map):
+                            issue["line_number"] = int(line_map[ln - 1])
 
             # Normalize and merge issues
             merged_issues = []
             llm_issues_list = []
             for issue in llm_analysis.get("issues", []) or []:
-                issue["file_path"] = str(file_path)
+                issue["file_path"] = file_path_str
+                issue["severity"], issue["severity_rank"] = normalize_severity(issue.get("severity"))
                 # Ensure code snippet exists
                 ln = issue.get("line_number", 0)
-                issue["code_snippet"] = _ensure_code_snippet(content, ln, issue.get("code_snippet", ""))
+                issue["code_snippet"] = _ensure_code_snippet(ln, issue.get("code_snippet", ""))
                 merged_issues.append(issue)
                 llm_issues_list.append(issue)
 
@@ -399,55 +817,8 @@ class CodeQualityAgent:
             if not metrics.get("security_score") and not metrics.get("maintainability_score"):
                 metrics.update(self._calculate_issue_based_scores(merged_issues))
 
-            # Build compact issue context with code snippets for LLM recs/fixes
-            def _extract_code_block(src: str, line: int, context: int = 4) -> str:
-                lines = src.split('\n')
-                if line <= 0 or line > len(lines):
-                    start = 0
-                    end = min(len(lines), 2 * context)
-                else:
-                    start = max(0, line - 1 - context)
-                    end = min(len(lines), line - 1 + context)
-                return "\n".join(lines[start:end])
-
-            compact_issues: List[Dict[str, Any]] = []
-            for it in merged_issues:
-                ln = it.get("line_number", 0)
-                snippet = it.get("code_snippet") or _extract_code_block(content, ln)
-                compact_issues.append({
-                    "category": it.get("category"),
-                    "severity": it.get("severity"),
-                    "line_number": ln,
-                    "title": it.get("title"),
-                    "description": it.get("description", ""),
-                    "code_snippet": snippet
-                })
-
             # Per-file recommendations with fixes: prefer LLM, fallback to heuristic
-            file_recommendations: List[Any] = []
-            try:
-                if self.llm:
-                    issues_json = json.dumps(compact_issues + llm_issues_list)[:20000]
-                    prompt = (
-                        f"You are a senior {language} code reviewer. Based on the issues (with code), "
-                        "generate up to 3 concrete recommendations each with a minimal fix snippet. "
-                        "Return STRICT JSON array of objects with keys: title, rationale, fix_snippet.\n\n"
-                        f"File: {file_path.name}\nIssues: {issues_json}"
-                    )
-                    rec_resp = await self.llm.ainvoke([HumanMessage(content=prompt)])
-                    parsed_recs = json.loads(rec_resp.content)
-                    if isinstance(parsed_recs, list):
-                        cleaned = []
-                        for x in parsed_recs[:3]:
-                            if isinstance(x, dict):
-                                cleaned.append({
-                                    "title": str(x.get("title", "Recommendation"))[:200],
-                                    "rationale": str(x.get("rationale", ""))[:1000],
-                                    "fix_snippet": str(x.get("fix_snippet", ""))[:4000]
-                                })
-                        file_recommendations = cleaned
-            except Exception:
-                file_recommendations = []
+            file_recommendations: List[Any] = clean_recommendations(llm_analysis.get("recommendations"))
             if not file_recommendations:
                 # Fallback to heuristic fixes derived from static issues
                 file_recommendations = _heuristic_fixes(static_mapped, language)
@@ -458,6 +829,9 @@ class CodeQualityAgent:
                     {"title": "Improve input validation and sanitize external data paths.", "rationale": "", "fix_snippet": ""}
                 ]
 
+            # Both sections report the same top recommendations; share one list
+            top_recommendations = file_recommendations[:3]
+
             # Build sections for per-file reporting
             def default_overall_rec(section_issues: List[Dict[str, Any]]) -> Dict[str, str]:
                 top_cat = section_issues[0].get("category", "maintainability") if section_issues else "maintainability"
@@ -469,16 +843,13 @@ class CodeQualityAgent:
 
             static_section = {
                 "issues": static_mapped,
-                "recommendations": file_recommendations if not llm_issues_list else [  # if no llm, reuse
-                    {"title": r.get("title", "Recommendation"), "rationale": r.get("rationale", ""), "fix_snippet": r.get("fix_snippet", "")}
-                    for r in file_recommendations
-                ][:3],
+                "recommendations": top_recommendations,
                 "overall_recommendation": default_overall_rec(static_mapped)
             }
 
             llm_section = {
                 "issues": llm_issues_list,
-                "recommendations": file_recommendations[:3],
+                "recommendations": top_recommendations,
                 "overall_recommendation": default_overall_rec(llm_issues_list or merged_issues)
             }
 
@@ -504,32 +875,117 @@ class CodeQualityAgent:
                 }
             }
 
+            if cache_key:
+                self.analysis_cache.put(cache_key, analysis)
+
             return analysis
                 
         except Exception as e:
             return {"error": f"Failed to analyze {file_path}: {str(e)}"}
     
-    async def _analyze_large_file(self, file_path: Path, content: str) -> Dict[str, Any]:
+    async def _file_response(self, content: str, language: str, filename: str) -> Tuple[str, bool]:
+        """Return the raw LLM analysis for a file, reusing near-identical files' responses.
+
+        The flag is True when the response was borrowed from a different file
+        through the semantic cache.
+        """
+        # Byte-identical code (at any path) reuses its stored response
+        response_key = self._response_key(language, content)
+        if response_key:
+            stored = self.analysis_cache.get_response(response_key)
+            if stored is not None:
+                return stored, False
+        
+        vector = None
+        if self.semantic_cache:
+            bucket = SemanticCache.bucket(language, content)
+            try:
+                loop = asyncio.get_running_loop()
+                vector = await loop.run_in_executor(None, self.semantic_cache.embed, content)
+                cached = self.semantic_cache.get(bucket, vector, content)
+                if cached is not None:
+                    return cached, True
+            except Exception as e:
+                logging.warning(f"Semantic cache lookup failed: {e}")
+        
+        async with self._llm_slots():
+            response = await self.analysis_runnable.ainvoke({
+                "code": content,
+                "language": language,
+                "filename": filename
+            })
+        if vector is not None:
+            self.semantic_cache.put(bucket, vector, content, response)
+        self._store_response(response_key, response)
+        return response, False
+    
+    def _llm_slots(self) -> asyncio.Semaphore:
+        """Semaphore bounding in-flight LLM requests across files and chunks.
+
+        Created per event loop, since each analysis may run under its own loop.
+        """
+        loop = asyncio.get_running_loop()
+        if self._llm_loop is not loop:
+            self._llm_loop = loop
+            self._llm_semaphore = asyncio.Semaphore(Config.MAX_CONCURRENCY)
+        return self._llm_semaphore
+    
+    def _response_key(self, language: str, content: str, chunk: bool = False) -> Optional[str]:
+        """Persistent raw-response cache key for code, or None when caching is off."""
+        if not self.analysis_cache:
+            return None
+        # Chunk and whole-file responses come from different prompts
+        prompt_language = f"{language}:chunk" if chunk else language
+        return AnalysisCache.make_response_key(prompt_language, content, Config.DEFAULT_MODEL, PROMPT_VERSION)
+    
+    def _store_response(self, response_key: Optional[str], response: str):
+        """Persist a raw LLM response that looks like a complete JSON object."""
+        if response_key and response.rstrip()[-1:] == "}":
+            self.analysis_cache.put_response(response_key, response)
+    
+    def _looks_generated(self, content: str) -> bool:
+        """Check whether content looks machine-generated or minified."""
+        # Minified bundles put thousands of characters on their first line
+        first_newline = content.find('\n', 0, 5001)
+        if first_newline == -1 and len(content) > 5000:
+            return True
+        # Only the file's leading comment block counts, never code or strings
+        for line in content[:2048].splitlines():
+            if not line.strip():
+                continue
+            if not HEADER_COMMENT_LINE.match(line):
+                return False
+            if GENERATED_MARKER.search(line):
+                return True
+        return False
+    
+    async def _analyze_large_file(self, file_path: Path, content: str, language: str) -> Dict[str, Any]:
         """Analyze a large file by chunking it and merging results."""
         try:
-            language = self.file_handler.detect_language(file_path)
-            
             # Create chunks of the file
             chunks = self._create_code_chunks(content, language)
             
             if not chunks:
                 return {"error": "Failed to create chunks from large file"}
             
-            # Analyze each chunk
-            chunk_results = []
-            for i, chunk in enumerate(chunks):
-                chunk_result = await self._analyze_chunk(chunk, language, file_path, i)
-                if chunk_result and "error" not in chunk_result:
-                    chunk_results.append(chunk_result)
+            # Analyze chunks concurrently; their LLM requests share the agent-wide limit
+            results = await asyncio.gather(
+                *[self._analyze_chunk(chunk, language, file_path, i) for i, chunk in enumerate(chunks)],
+                return_exceptions=True
+            )
+            chunk_results = [
+                r for r in results
+                if isinstance(r, dict) and r and "error" not in r
+            ]
             
             # Merge chunk results using LLM
             merged_result = await self._merge_chunk_results(chunk_results, file_path, language)
             
+            # Chunks whose analysis failed make the merged result incomplete
+            failed_chunks = len(chunks) - len(chunk_results)
+            if failed_chunks:
+                merged_result["failed_chunks"] = failed_chunks
+            
             return merged_result
             
         except Exception as e:
@@ -539,28 +995,38 @@ class CodeQualityAgent:
         """Create meaningful chunks from code content."""
         try:
             chunk_size = Config.MAX_FILE_SIZE // 4  # 256KB chunks
-            overlap = 100  # Lines of overlap between chunks
+            overlap = 100  # Lines of overlap between chunks (at most a quarter of a chunk)
             
-            lines = content.split('\n')
             chunks = []
             
+            # A chunk is a single slice of content rather than a join over its lines
+            line_starts = line_start_offsets(content)
+            num_lines = len(line_starts) - 1
+            
+            # Candidate boundary lines: top-level Python statements, or JS/TS lines
+            # closing a block. One regex scan over the content marks them all.
+            if language == "python":
+                boundary_mask = line_mask(content, line_starts, PY_TOP_LEVEL_LINE)
+            elif language in ["javascript", "typescript"]:
+                boundary_mask = line_mask(content, line_starts, JS_BLOCK_END_LINE)
+            
             # Calculate lines per chunk (approximate)
-            avg_line_length = len(content) / len(lines) if lines else 50
-            lines_per_chunk = int(chunk_size / avg_line_length)
+            avg_line_length = len(content) / num_lines
+            lines_per_chunk = max(1, int(chunk_size / avg_line_length))
             
             start_line = 0
             chunk_id = 0
             
-            while start_line < len(lines):
-                end_line = min(start_line + lines_per_chunk, len(lines))
+            while start_line < num_lines:
+                end_line = min(start_line + lines_per_chunk, num_lines)
                 
                 # Adjust chunk boundaries to avoid breaking functions/classes
-                if language == "python" and end_line < len(lines):
-                    end_line = self._adjust_python_chunk_boundary(lines, start_line, end_line)
-                elif language in ["javascript", "typescript"] and end_line < len(lines):
-                    end_line = self._adjust_js_chunk_boundary(lines, start_line, end_line)
+                if language == "python" and end_line < num_lines:
+                    end_line = self._adjust_python_chunk_boundary(boundary_mask, start_line, end_line)
+                elif language in ["javascript", "typescript"] and end_line < num_lines:
+                    end_line = self._adjust_js_chunk_boundary(boundary_mask, start_line, end_line)
                 
-                chunk_content = '\n'.join(lines[start_line:end_line])
+                chunk_content = content[line_starts[start_line]:line_starts[end_line] - 1]
                 
                 chunks.append({
                     'id': chunk_id,
@@ -570,12 +1036,14 @@ class CodeQualityAgent:
                     'size': len(chunk_content)
                 })
                 
-                # Move start with overlap
-                start_line = max(start_line + lines_per_chunk - overlap, end_line)
-                chunk_id += 1
-                
-                if start_line >= len(lines):
+                if end_line >= num_lines:
                     break
+                
+                # Next chunk overlaps the end of this one, so no line is skipped; the
+                # overlap is capped so chunks of few long lines still move forward
+                chunk_overlap = min(overlap, (end_line - start_line) // 4)
+                start_line = max(end_line - chunk_overlap, start_line + 1)
+                chunk_id += 1
             
             return chunks
             
@@ -583,58 +1051,111 @@ class CodeQualityAgent:
             logging.error(f"Failed to create code chunks: {e}")
             return []
     
-    def _adjust_python_chunk_boundary(self, lines: List[str], start: int, end: int) -> int:
+    def _adjust_python_chunk_boundary(self, top_level: np.ndarray, start: int, end: int) -> int:
         """Adjust chunk boundary to avoid breaking Python functions/classes."""
-        # Look backwards from end to find a good breaking point
-        for i in range(end - 1, start, -1):
-            line = lines[i].strip()
-            # Break at the end of a function or class
-            if line and not line.startswith(' ') and not line.startswith('\t'):
-                if i < end - 10:  # Ensure meaningful chunk size
-                    return i + 1
+        # End the chunk just before the last top-level statement in the back
+        # half of the chunk; keep the original end when there is none
+        low = start + 1 + (end - start) // 2
+        candidates = np.flatnonzero(top_level[low:max(low, end - 10)])
+        if candidates.size:
+            return low + int(candidates[-1])
         return end
     
-    def _adjust_js_chunk_boundary(self, lines: List[str], start: int, end: int) -> int:
+    def _adjust_js_chunk_boundary(self, block_end: np.ndarray, start: int, end: int) -> int:
         """Adjust chunk boundary to avoid breaking JavaScript functions."""
-        # Look for function boundaries
-        for i in range(end - 1, start, -1):
-            line = lines[i].strip()
-            if line.endswith('}') and not line.startswith('//'):
-                if i < end - 10:  # Ensure meaningful chunk size
-                    return i + 1
+        # End the chunk right after the last line closing a block in the back
+        # half of the chunk; keep the original end when there is none
+        low = start + 1 + (end - start) // 2
+        candidates = np.flatnonzero(block_end[low:max(low, end - 10)])
+        if candidates.size:
+            return low + 1 + int(candidates[-1])
         return end
     
+    async def _bounded_stream(self, inputs: Dict[str, Any]) -> str:
+        """Stream one chunk analysis response while holding an LLM request slot."""
+        async with self._llm_slots():
+            return await self._collect_stream(self.chunk_runnable.astream(inputs))
+    
+    async def _collect_stream(self, stream) -> str:
+        """Join streamed text pieces once instead of concatenating per piece."""
+        parts: List[str] = []
+        async for piece in stream:
+            parts.append(piece)
+        return "".join(parts)
+    
+    async def _chunk_response(self, digest: str, inputs: Dict[str, Any]) -> str:
+        """Return the raw LLM response for a chunk, sharing it across identical chunks."""
+        with _CHUNK_RESPONSES_LOCK:
+            cached = _CHUNK_RESPONSES.get(digest)
+            if cached is not None:
+                _CHUNK_RESPONSES.move_to_end(digest)
+        if cached is not None:
+            return cached
+        if not self.chunk_runnable:
+            return "{}"
+        
+        # Concurrent identical chunks wait on the first one's request
+        pending = self._chunk_pending.get(digest)
+        if pending is not None:
+            return await pending
+        
+        # Chunks seen in earlier runs come from the persistent cache
+        response_key = self._response_key(inputs["language"], inputs["code"], chunk=True)
+        response = self.analysis_cache.get_response(response_key) if response_key else None
+        if response is None:
+            pending = asyncio.ensure_future(self._bounded_stream(inputs))
+            self._chunk_pending[digest] = pending
+            try:
+                response = await pending
+            finally:
+                del self._chunk_pending[digest]
+            self._store_response(response_key, response)
+        
+        with _CHUNK_RESPONSES_LOCK:
+            _CHUNK_RESPONSES[digest] = response
+            if len(_CHUNK_RESPONSES) > Config.CHUNK_CACHE_SIZE:
+                _CHUNK_RESPONSES.popitem(last=False)
+        return response
+    
     async def _analyze_chunk(self, chunk: Dict[str, Any], language: str, file_path: Path, chunk_id: int) -> Dict[str, Any]:
         """Analyze a single chunk of code."""
         try:
             content = chunk['content']
             
-            # Run LLM analysis on chunk
-            response = "{}"
-            if self.analysis_runnable:
-                try:
-                    response = await self.analysis_runnable.ainvoke({
-                        "code": content,
-                        "language": language,
-                        "filename": f"{file_path.name} (chunk {chunk_id + 1})"
-                    })
-                except Exception:
-                    response = "{}"
+            # Identical chunks (generated or repetitive code) share one LLM response;
+            # the raw text is cached so each use parses and offsets its own copy
+            digest = hashlib.blake2b(f"{language}\0{content}".encode('utf-8'), digest_size=16).hexdigest()
             
-            # Parse JSON response
-            chunk_analysis = {}
+            # Run LLM analysis on chunk; a failure is reported, never treated as clean
             try:
-                chunk_analysis = json.loads(response)
-            except Exception:
-                chunk_analysis = {"issues": [], "metrics": {}, "summary": ""}
+                response = await self._chunk_response(digest, {
+                    "code": content,
+                    "language": language,
+                    "filename": f"{file_path.name} (chunk {chunk_id + 1})"
+                })
+            except Exception as e:
+                return {"error": f"Chunk LLM analysis failed: {str(e)}"}
+            
+            # Parse JSON response, keeping only the fields the merge step reads;
+            # big responses parse in a worker so other chunks' I/O keeps moving
+            if len(response) > OFFLOOP_PARSE_CHARS:
+                loop = asyncio.get_running_loop()
+                chunk_analysis = await loop.run_in_executor(None, extract_chunk_fields, response)
+            else:
+                chunk_analysis = extract_chunk_fields(response)
+            if chunk_analysis is None:
+                return {"error": "Chunk LLM response was not a JSON object"}
             
             # Adjust line numbers based on chunk position
             line_offset = chunk['start_line'] - 1
-            for issue in chunk_analysis.get("issues", []):
-                if "line_number" in issue:
-                    issue["line_number"] += line_offset
-                issue["file_path"] = str(file_path)
-                issue["chunk_id"] = chunk_id
+            issues = chunk_analysis["issues"]
+            if line_offset:
+                for issue in issues:
+                    if "line_number" in issue:
+                        issue["line_number"] += line_offset
+            tags = {"file_path": str(file_path), "chunk_id": chunk_id}
+            for issue in issues:
+                issue.update(tags)
             
             chunk_analysis["chunk_info"] = {
                 "id": chunk_id,
@@ -656,98 +1177,94 @@ class CodeQualityAgent:
             
             # Collect all issues and metrics
             all_issues = []
-            all_metrics = {}
+            metric_totals: Dict[str, float] = defaultdict(float)
             chunk_summaries = []
+            total_size = 0
             
             for chunk_result in chunk_results:
+                chunk_info = chunk_result.get("chunk_info") or EMPTY_MAPPING
+                total_size += chunk_info.get("size", 0)
+                
                 # Collect issues
-                for issue in chunk_result.get("issues", []):
-                    all_issues.append(issue)
+                all_issues.extend(chunk_result.get("issues", []))
                 
                 # Collect metrics
-                chunk_metrics = chunk_result.get("metrics", {})
+                chunk_metrics = chunk_result.get("metrics") or EMPTY_MAPPING
                 for metric, value in chunk_metrics.items():
-                    if metric in all_metrics:
-                        all_metrics[metric] += value
-                    else:
-                        all_metrics[metric] = value
+                    metric_totals[metric] += value
                 
                 # Collect summaries
                 if chunk_result.get("summary"):
-                    chunk_info = chunk_result.get("chunk_info", {})
                     chunk_summaries.append(f"Chunk {chunk_info.get('id', 0)} (lines {chunk_info.get('start_line', 0)}-{chunk_info.get('end_line', 0)}): {chunk_result['summary']}")
             
-            # Use LLM to create comprehensive summary if available
-            comprehensive_summary = ""
-            if self.llm and chunk_summaries:
-                try:
-                    merge_prompt = f"""
-                    Analyze the following chunk summaries from a large {language} file ({file_path.name}) and provide a comprehensive summary of the overall code quality:
-                    
-                    Chunk Summaries:
-                    {chr(10).join(chunk_summaries)}
-                    
-                    Total Issues Found: {len(all_issues)}
-                    
-                    Provide a concise overall summary highlighting the main quality concerns and patterns across all chunks.
-                    """
-                    
-                    summary_response = await self.llm.ainvoke([HumanMessage(content=merge_prompt)])
-                    comprehensive_summary = summary_response.content
-                except Exception:
-                    comprehensive_summary = f"Large file analysis completed. Found {len(all_issues)} issues across {len(chunk_results)} code chunks."
-            else:
-                comprehensive_summary = f"Large file analysis completed. Found {len(all_issues)} issues across {len(chunk_results)} code chunks."
-            
             # Average out metrics
-            num_chunks = len(chunk_results)
-            for metric in all_metrics:
-                all_metrics[metric] = all_metrics[metric] / num_chunks
+            factor = 1.0 / len(chunk_results)
+            all_metrics = {metric: total * factor for metric, total in metric_totals.items()}
             
-            # Remove duplicate issues (same line, same category)
-            unique_issues = []
-            seen_issues = set()
+            # Remove duplicate issues (same line, same category); dicts keep first-seen order
+            deduped: Dict[Tuple[Any, Any, Any], Dict[str, Any]] = {}
             for issue in all_issues:
-                issue_key = (issue.get("line_number", 0), issue.get("category", ""), issue.get("title", ""))
-                if issue_key not in seen_issues:
-                    seen_issues.add(issue_key)
-                    unique_issues.append(issue)
+                deduped.setdefault(
+                    (issue.get("line_number", 0), issue.get("category", ""), issue.get("title", "")),
+                    issue
+                )
+            unique_issues = list(deduped.values())
             
-            # Per-file recommendations for large files via LLM (with fixes)
-            file_recommendations: List[Any] = []
-            try:
-                if self.llm:
-                    compact_issues = []
-                    # Note: cannot recover code here; rely on issue snippets if present
-                    for it in unique_issues:
-                        compact_issues.append({
-                            "category": it.get("category"),
-                            "severity": it.get("severity"),
-                            "line_number": it.get("line_number", 0),
-                            "title": it.get("title"),
-                            "description": it.get("description", ""),
-                            "code_snippet": it.get("code_snippet", "")
-                        })
-                    issues_json = json.dumps(compact_issues)[:20000]
-                    prompt = (
-                        f"You are a senior {language} code reviewer. Based on the merged issues, "
-                        "generate up to 3 concrete recommendations each with a minimal fix snippet. "
-                        "Return STRICT JSON array of objects with keys: title, rationale, fix_snippet.\n\n"
-                        f"File: {file_path.name}\nIssues: {issues_json}"
-                    )
+            filename = file_path.name
+            fallback_summary = f"Large file analysis completed. Found {len(all_issues)} issues across {len(chunk_results)} code chunks."
+            
+            async def summarize() -> str:
+                # Use LLM to create comprehensive summary if available
+                if not (self.llm and chunk_summaries):
+                    return fallback_summary
+                # A few short summaries read fine as-is; skip the LLM round trip
+                joined_summaries = "\n".join(chunk_summaries)
+                if len(chunk_summaries) <= MERGE_SUMMARY_MAX_CHUNKS or len(joined_summaries) < MERGE_SUMMARY_MAX_CHARS:
+                    return joined_summaries
+                merge_prompt = MERGE_SUMMARY_PROMPT.format(
+                    language=language,
+                    filename=filename,
+                    summaries=joined_summaries,
+                    issue_count=len(all_issues)
+                )
+                async with self._llm_slots():
+                    summary_response = await self.llm.ainvoke([HumanMessage(content=merge_prompt)])
+                return summary_response.content
+            
+            async def recommend() -> List[Any]:
+                # Per-file recommendations for large files via LLM (with fixes)
+                if not self.llm:
+                    return []
+                # Note: cannot recover code here; rely on issue snippets if present.
+                # Built lazily so issues past the prompt budget are never copied.
+                compact_issues = (
+                    {
+                        "category": it.get("category"),
+                        "severity": it.get("severity"),
+                        "line_number": it.get("line_number", 0),
+                        "title": it.get("title"),
+                        "description": it.get("description", ""),
+                        "code_snippet": (it.get("code_snippet") or "")[:PROMPT_SNIPPET_CHARS]
+                    }
+                    for it in unique_issues
+                )
+                issues_json = json_bounded(compact_issues, 20000)
+                prompt = FILE_RECOMMENDATIONS_PROMPT.format(
+                    language=language,
+                    filename=filename,
+                    issues=issues_json
+                )
+                async with self._llm_slots():
                     rec_resp = await self.llm.ainvoke([HumanMessage(content=prompt)])
-                    parsed_recs = json.loads(rec_resp.content)
-                    if isinstance(parsed_recs, list):
-                        cleaned = []
-                        for x in parsed_recs[:3]:
-                            if isinstance(x, dict):
-                                cleaned.append({
-                                    "title": str(x.get("title", "Recommendation"))[:200],
-                                    "rationale": str(x.get("rationale", ""))[:1000],
-                                    "fix_snippet": str(x.get("fix_snippet", ""))[:4000]
-                                })
-                        file_recommendations = cleaned
-            except Exception:
+                return clean_recommendations(loose_json_array(rec_resp.content))
+            
+            # The summary and recommendation requests are independent; run them together
+            comprehensive_summary, file_recommendations = await asyncio.gather(
+                summarize(), recommend(), return_exceptions=True
+            )
+            if isinstance(comprehensive_summary, BaseException):
+                comprehensive_summary = fallback_summary
+            if isinstance(file_recommendations, BaseException):
                 file_recommendations = []
             if not file_recommendations:
                 file_recommendations = [
@@ -760,7 +1277,7 @@ class CodeQualityAgent:
                 "metrics": all_metrics,
                 "summary": comprehensive_summary,
                 "chunk_count": len(chunk_results),
-                "total_size": sum(chunk.get("chunk_info", {}).get("size", 0) for chunk in chunk_results),
+                "total_size": total_size,
                 "is_chunked_analysis": True,
                 "recommendations": file_recommendations
             }
@@ -768,9 +1285,9 @@ class CodeQualityAgent:
         except Exception as e:
             logging.error(f"Failed to merge chunk results: {e}")
             # Return basic merged result
-            all_issues = []
-            for chunk_result in chunk_results:
-                all_issues.extend(chunk_result.get("issues", []))
+            all_issues = list(chain.from_iterable(
+                chunk_result.get("issues", ()) for chunk_result in chunk_results
+            ))
             
             return {
                 "issues": all_issues,
@@ -789,42 +1306,28 @@ class CodeQualityAgent:
                 "overall_score": 100.0
             }
         
-        # Severity weights
-        severity_weights = {
-            "critical": 25,
-            "high": 15,
-            "medium": 8,
-            "low": 3,
-            "info": 1
-        }
-        
-        # Category weights
-        category_weights = {
-            "security": 20,
-            "complexity": 10,
-            "maintainability": 5,
-            "best_practices": 3,
-            "code_duplication": 2,
-            "testing": 5,
-            "documentation": 2
-        }
-        
-        # Calculate penalty scores
-        security_penalty = 0
-        maintainability_penalty = 0
-        total_penalty = 0
+        # Penalty per issue = severity weight x category weight; bincount then sums
+        # them per score bucket (0: other, 1: security, 2: maintainability)
+        n = len(issues)
+        severity_w = np.fromiter(
+            (SEVERITY_PENALTY_WEIGHTS.get(issue.get("severity", "info"), 1) for issue in issues),
+            dtype=np.int64, count=n
+        )
+        categories = [issue.get("category", "unknown") for issue in issues]
+        category_w = np.fromiter(
+            (CATEGORY_PENALTY_WEIGHTS.get(category, 1) for category in categories),
+            dtype=np.int64, count=n
+        )
+        buckets = np.fromiter(
+            (PENALTY_BUCKETS.get(category, 0) for category in categories),
+            dtype=np.int64, count=n
+        )
+        penalties = severity_w * category_w
+        bucket_totals = np.bincount(buckets, weights=penalties, minlength=3)
         
-        for issue in issues:
-            severity = issue.get("severity", "info")
-            category = issue.get("category", "unknown")
-            
-            penalty = severity_weights.get(severity, 1) * category_weights.get(category, 1)
-            total_penalty += penalty
-            
-            if category == "security":
-                security_penalty += penalty
-            elif category in ["maintainability", "complexity", "best_practices", "code_duplication", "documentation"]:
-                maintainability_penalty += penalty
+        total_penalty = int(penalties.sum())
+        security_penalty = int(bucket_totals[1])
+        maintainability_penalty = int(bucket_totals[2])
         
         # Convert penalties to scores (0-100 scale)
         # More issues = lower scores
@@ -840,34 +1343,17 @@ class CodeQualityAgent:
 
     def _generate_recommendations(self, issues: List[Dict]) -> List[str]:
         """Generate high-level recommendations based on issues."""
-        recommendations = []
-        
-        # Count issues by category
-        category_counts = {}
-        severity_counts = {}
-        
-        for issue in issues:
-            category = issue.get("category", "unknown")
-            severity = issue.get("severity", "info")
-            
-            category_counts[category] = category_counts.get(category, 0) + 1
-            severity_counts[severity] = severity_counts.get(severity, 0) + 1
+        counts = {
+            "severity": Counter(issue.get("severity", "info") for issue in issues),
+            "category": Counter(issue.get("category", "unknown") for issue in issues)
+        }
         
         # Generate recommendations based on patterns
-        if severity_counts.get("critical", 0) > 0:
-            recommendations.append("🚨 Address critical security and performance issues immediately")
-        
-        if category_counts.get("security", 0) > 3:
-            recommendations.append("🔒 Consider implementing a security review process")
-        
-        if category_counts.get("complexity", 0) > 5:
-            recommendations.append("🧩 Refactor complex functions to improve maintainability")
-        
-        if category_counts.get("testing", 0) > 3:
-            recommendations.append("🧪 Increase test coverage for better code reliability")
-        
-        if category_counts.get("documentation", 0) > 3:
-            recommendations.append("📚 Improve code documentation and comments")
+        recommendations = [
+            message
+            for field, value, threshold, message in RECOMMENDATION_RULES
+            if counts[field][value] > threshold
+        ]
         
         return recommendations
     
@@ -882,7 +1368,8 @@ class CodeQualityAgent:
             if not self.qa_runnable:
                 return self._offline_answer(question, analysis_context)
             
-            context_str = json.dumps(analysis_context, indent=2)
+            # Compact JSON: indentation only spends prompt tokens
+            context_str = json_codec.dumps(analysis_context)
             response = await self.qa_runnable.ainvoke({
                 "question": question,
                 "context": context_str
@@ -895,23 +1382,10 @@ class CodeQualityAgent:
         """Very lightweight Q&A without LLM: surface top issues relevant to the question."""
         q = question.lower()
         issues = ctx.get("issues", [])
-        filtered = []
-        buckets = {
-            "security": ["security", "xss", "sql", "injection", "secret", "auth", "crypto"],
-            "performance": ["performance", "slow", "latency", "memory", "optimize"],
-            "complexity": ["complexity", "refactor", "maintainability"],
-            "testing": ["test", "coverage"],
-            "documentation": ["doc", "comment"],
-        }
-        target = None
-        for cat, kws in buckets.items():
-            if any(k in q for k in kws):
-                target = cat
-                break
-        for it in issues:
-            if target is None or it.get("category") == target:
-                filtered.append(it)
-        filtered = sorted(filtered, key=lambda x: Config.SEVERITY_LEVELS.get(x.get("severity", "info"), 0), reverse=True)[:5]
+        target = next((cat for cat, pattern in OFFLINE_QUESTION_BUCKETS if pattern.search(q)), None)
+        matching = (it for it in issues if target is None or it.get("category") == target)
+        # Only the five most severe are shown; nlargest keeps ties in input order like a stable sort
+        filtered = heapq.nlargest(5, matching, key=severity_key)
         if not filtered:
             return "No matching issues found. Try asking about security, performance, complexity, testing, or documentation."
         lines = ["Here are relevant issues:"]
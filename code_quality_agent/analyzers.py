@@ -14,6 +14,7 @@ Key Components:
 Functions/Classes:
 - `class CodeAnalyzer`: Main analyzer class
   - `__init__(self)`: Initialize with available analysis tools
+  - `cache_tag`: Property identifying analyzer version and enabled tools for caching
   - `_check_available_tools(self)`: Detect which analysis tools are installed
   - `analyze_python_file(self, file_path)`: Comprehensive Python file analysis
   - `analyze_javascript_file(self, file_path)`: JavaScript/TypeScript file analysis
@@ -49,14 +50,30 @@ try:
 except ImportError:
     cc_visit = mi_visit = h_visit = None
 
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+from .utils import json_codec
+
 
 class CodeAnalyzer:
     """Comprehensive code analyzer for multiple languages."""
     
+    # Bump when analyzer output changes so cached static results are not reused
+    VERSION = 1
+    
     def __init__(self):
         """Initialize analyzer with available tools."""
         self.available_tools = self._check_available_tools()
     
+    @property
+    def cache_tag(self) -> str:
+        """Identify this analyzer's output format and enabled tools for result caching."""
+        enabled = ','.join(sorted(tool for tool, ok in self.available_tools.items() if ok))
+        return f"{self.VERSION}:{enabled}"
+    
     def _check_available_tools(self) -> Dict[str, bool]:
         """Check which analysis tools are available."""
         tools = {
@@ -166,8 +183,7 @@ class CodeAnalyzer:
             
             # Parse JSON content of notebook
             try:
-                import json
-                notebook_data = json.loads(content)
+                notebook_data = json_codec.loads(content)
                 
                 # Extract code cells and analyze them
                 code_cells = []
@@ -557,7 +573,7 @@ class CodeAnalyzer:
             ], capture_output=True, text=True, timeout=30)
             
             if result.returncode == 0:
-                data = json.loads(result.stdout)
+                data = json_codec.loads(result.stdout)
                 issues = []
                 
                 for finding in data.get('results', []):
@@ -579,6 +595,8 @@ class CodeAnalyzer:
     def _fingerprint_code_blocks(self, content: str, language: str) -> List[Dict[str, Any]]:
         """Create content fingerprints to detect near-duplicate code across files.
         Returns a list of {hash, start_line, end_line, size} entries.
+        Hashes are xxh3_64 when xxhash is installed (SHA-1 otherwise); they only
+        need to match within one run, not be cryptographically strong.
         """
         lines = content.split('\n')
         window = 10  # sliding window size
@@ -594,7 +612,10 @@ class CodeAnalyzer:
             norm = normalize(block)
             if len(norm) < 40:
                 continue
-            digest = hashlib.sha1(norm.encode('utf-8')).hexdigest()
+            if xxhash is not None:
+                digest = xxhash.xxh3_64_hexdigest(norm.encode('utf-8'))
+            else:
+                digest = hashlib.sha1(norm.encode('utf-8')).hexdigest()
             fingerprints.append({
                 'hash': digest,
                 'start_line': i + 1,
@@ -31,7 +31,7 @@ import asyncio
 import sys
 import os
 from pathlib import Path
-from typing import Optional
+from typing import Optional, TYPE_CHECKING
 
 import click
 from rich.console import Console
@@ -39,9 +39,11 @@ from rich.prompt import Prompt, Confirm
 from rich.panel import Panel
 from rich.text import Text
 
+from . import __version__
 from .config import Config
-from .agent import CodeQualityAgent
-from .report_generator import ReportGenerator
+
+if TYPE_CHECKING:
+    from .agent import CodeQualityAgent
 
 
 # Force UTF-8 stdout/stderr on Windows to avoid Unicode errors
@@ -57,9 +59,7 @@ console = Console(emoji=False)
 def launch_web_interface():
     """Launch the Streamlit web interface."""
     try:
-        import subprocess
-        import sys
-        from pathlib import Path
+        from .utils.web_launcher import run_streamlit
         
         console.print("[blue]Launching Code Quality Intelligence Web Interface...[/blue]")
         console.print("[dim]This will open in your web browser at http://localhost:8501[/dim]\n")
@@ -77,15 +77,7 @@ def launch_web_interface():
             console.print("[blue]Try: python cqi-web.py[/blue]")
             return
         
-        # Launch Streamlit
-        cmd = [
-            sys.executable, "-m", "streamlit", "run", str(web_app_path),
-            "--server.address", "localhost",
-            "--server.port", "8501",
-            "--browser.gatherUsageStats", "false"
-        ]
-        
-        subprocess.run(cmd)
+        run_streamlit(web_app_path)
         
     except KeyboardInterrupt:
         console.print("\n[yellow]Web interface stopped by user[/yellow]")
@@ -97,7 +89,7 @@ def launch_web_interface():
 
 
 @click.group()
-@click.version_option(version="1.0.0")
+@click.version_option(version=__version__)
 @click.option('--web', is_flag=True, help='Launch the Streamlit web interface')
 def cli(web):
     """Code Quality Intelligence Agent - Analyze code repositories with AI-powered insights."""
@@ -114,7 +106,8 @@ def cli(web):
 @click.option('--interactive', '-i', is_flag=True, help='Enable interactive Q&A mode after analysis')
 @click.option('--groq-key', type=str, help='Groq API key (overrides environment variable)')
 @click.option('--branch', '-b', type=str, help='Specific branch to analyze (GitHub repos only)')
-def analyze(path: str, output: Optional[str], format: str, interactive: bool, groq_key: Optional[str], branch: Optional[str]):
+@click.option('--no-cache', is_flag=True, help='Re-analyze every file instead of reusing cached results')
+def analyze(path: str, output: Optional[str], format: str, interactive: bool, groq_key: Optional[str], branch: Optional[str], no_cache: bool):
     """Analyze code repository for quality issues.
     
     PATH can be:
@@ -134,6 +127,9 @@ def analyze(path: str, output: Optional[str], format: str, interactive: bool, gr
         import os
         os.environ['GROQ_API_KEY'] = groq_key
     
+    if no_cache:
+        Config.ENABLE_CACHE = False
+    
     # Validate configuration (offline allowed)
     try:
         Config.validate()
@@ -152,6 +148,10 @@ def analyze(path: str, output: Optional[str], format: str, interactive: bool, gr
 
 async def _run_analysis(path: str, output: Optional[str], format: str, interactive: bool, branch: Optional[str] = None):
     """Run the analysis workflow."""
+    # Heavy modules are imported per command so --help/--version stay fast
+    from .agent import CodeQualityAgent
+    from .report_generator import ReportGenerator
+    
     try:
         # Initialize agent
         console.print("[blue]🚀 Initializing Code Quality Intelligence Agent...[/blue]")
@@ -221,7 +221,7 @@ def _show_analysis_start(path: str):
     console.print()
 
 
-async def _interactive_mode(agent: CodeQualityAgent, analysis_results: dict):
+async def _interactive_mode(agent: "CodeQualityAgent", analysis_results: dict):
     """Run interactive Q&A mode."""
     console.print("\n[bold green]🤖 Interactive Q&A Mode[/bold green]")
     console.print("[dim]Ask questions about your codebase. Type 'exit' to quit.[/dim]\n")
@@ -382,13 +382,13 @@ def dashboard():
         console.print("[blue]🚀 Launching Code Quality Intelligence Dashboard...[/blue]")
         console.print("[dim]This will open in your web browser at http://localhost:8501[/dim]\n")
         
-        # Launch Streamlit
+        # Launch Streamlit (close_fds=False keeps subprocess on the posix_spawn path)
         subprocess.run([
             sys.executable, "-m", "streamlit", "run", "streamlit_app.py",
             "--server.address", "localhost",
             "--server.port", "8501",
             "--browser.gatherUsageStats", "false"
-        ])
+        ], close_fds=False)
         
     except KeyboardInterrupt:
         console.print("\n[yellow]Dashboard stopped by user[/yellow]")
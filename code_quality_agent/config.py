@@ -17,6 +17,16 @@ Functions/Classes:
     - `TEMPERATURE`: LLM temperature setting (0.1)
     - `MAX_TOKENS`: Maximum LLM tokens (4096)
     - `MAX_FILE_SIZE`: Maximum file size for analysis (1MB)
+    - `MAX_CONCURRENCY`: Maximum files analyzed, and LLM requests in flight, at once (8)
+    - `MIN_LLM_BYTES`: Files with less content skip LLM analysis (64)
+    - `LLM_FOCUS_MIN_BYTES`: Files this large send only statically flagged regions to the LLM (32KB)
+    - `ENABLE_CACHE`: Reuse analysis results for unchanged files (on unless CQI_CACHE=0)
+    - `CACHE_DB`: SQLite file for cached analysis results
+    - `CACHE_MAX_ENTRIES`: Entries kept per cache table before the oldest are dropped (20000)
+    - `CHUNK_CACHE_SIZE`: In-memory LLM responses kept process-wide for repeated large-file chunks (256)
+    - `SEMANTIC_CACHE`: Reuse LLM responses for near-identical files (opt-in via CQI_SEMANTIC_CACHE=1)
+    - `SEMANTIC_CACHE_THRESHOLD`: Cosine similarity required for a semantic cache hit (0.98)
+    - `SEMANTIC_CACHE_SIZE`: Maximum semantic cache entries (1000)
     - `SUPPORTED_EXTENSIONS`: Set of supported file extensions
     - `QUALITY_CATEGORIES`: List of quality analysis categories
     - `SEVERITY_LEVELS`: Dictionary mapping severity levels to numeric values
@@ -44,6 +54,23 @@ class Config:
     
     # File analysis settings
     MAX_FILE_SIZE = 1024 * 1024  # 1MB
+    MAX_CONCURRENCY = 8  # Concurrent files and in-flight LLM requests, kept under Groq rate limits
+    MIN_LLM_BYTES = 64  # Trivial files (e.g. one-line __init__.py) get static analysis only
+    LLM_FOCUS_MIN_BYTES = 32 * 1024  # Above this, prompts carry flagged regions instead of the whole file
+    
+    # Analysis cache settings
+    ENABLE_CACHE = os.getenv("CQI_CACHE", "1") != "0"
+    CACHE_DB = os.getenv(
+        "CQI_CACHE_DB",
+        str(Path.home() / ".cache" / "code-quality-intelligence" / "analysis.db")
+    )
+    CACHE_MAX_ENTRIES = 20000
+    CHUNK_CACHE_SIZE = 256  # Raw responses for identical chunks (license headers, vendored code)
+    # Near-duplicates can differ in line numbers, so semantic reuse is opt-in
+    SEMANTIC_CACHE = os.getenv("CQI_SEMANTIC_CACHE", "0") == "1"
+    SEMANTIC_CACHE_THRESHOLD = 0.98
+    SEMANTIC_CACHE_SIZE = 1000
+    
     SUPPORTED_EXTENSIONS = {
         '.py', '.js', '.jsx', '.ts', '.tsx', '.java', '.cpp', '.c', '.h',
         '.cs', '.go', '.rs', '.php', '.rb', '.swift', '.kt', '.scala', '.ipynb'
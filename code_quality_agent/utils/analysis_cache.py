@@ -0,0 +1,136 @@
+"""
+Purpose: Persistent cache for per-file analysis results
+
+High-level Overview:
+Stores the analysis dict produced for a file in a local SQLite database, keyed by the file path, a hash of its content, the model, the analyzer setup and the prompt version. Unchanged files are served from the cache on later runs instead of being re-analyzed. Raw LLM responses and static analyzer results are also stored by content hash alone, so identical code at another path (copied files, repeated large-file chunks) or a file whose LLM analysis must be redone skips that work.
+
+Key Components:
+- SQLite-backed key/value storage
+- Content-hash keys (edits invalidate entries implicitly)
+- Path-independent raw LLM response entries
+- Per-table entry bound (oldest writes are dropped first)
+- Thread-safe access from the analysis event loop
+
+Functions/Classes:
+- `class AnalysisCache`: SQLite cache of analysis results
+  - `__init__(self, db_path, max_entries)`: Open (or create) the cache database
+  - `make_key(file_path, content, model, analyzer_tag, prompt_version)`: Build the cache key for a file
+  - `get(self, key)`: Return the cached analysis or None
+  - `put(self, key, analysis)`: Store an analysis result
+  - `make_static_key(language, content, analyzer_tag)`: Build the cache key for static analyzer results
+  - `make_response_key(language, content, model, prompt_version)`: Build the cache key for a raw LLM response
+  - `get_response(self, key)`: Return a cached raw LLM response or None
+  - `put_response(self, key, response)`: Store a raw LLM response
+  - `_trim(self, table)`: Drop the oldest entries past the table's bound
+  - `close(self)`: Close the database connection
+"""
+
+import hashlib
+import logging
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from . import json_codec
+
+
+class AnalysisCache:
+    """SQLite cache of per-file analysis results."""
+
+    # Bump when the shape of stored analysis dicts changes
+    SCHEMA_VERSION = 2
+
+    def __init__(self, db_path: str, max_entries: int = 20000):
+        """Open (or create) the cache database, keeping at most max_entries per table."""
+        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        self.max_entries = max_entries
+        # The agent may be driven from a worker thread (web UI); guard with a lock
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, json BLOB)"
+            )
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, response TEXT)"
+            )
+
+    @staticmethod
+    def make_key(file_path: Path, content: str, model: str, analyzer_tag: str, prompt_version: int) -> str:
+        """Build the cache key for a file's current content and analysis setup."""
+        digest = hashlib.sha256(content.encode('utf-8')).hexdigest()
+        return f"{AnalysisCache.SCHEMA_VERSION}:{digest}:{model}:{prompt_version}:{analyzer_tag}:{file_path}"
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached analysis for key, or None."""
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT json FROM cache WHERE key = ?", (key,)
+                ).fetchone()
+            return json_codec.loads(row[0]) if row else None
+        except (sqlite3.Error, ValueError) as e:
+            logging.warning(f"Analysis cache read failed: {e}")
+            return None
+
+    def put(self, key: str, analysis: Dict[str, Any]):
+        """Store an analysis result under key."""
+        try:
+            with self._lock, self._conn:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO cache (key, json) VALUES (?, ?)",
+                    (key, json_codec.dumps(analysis))
+                )
+                self._trim("cache")
+        except (sqlite3.Error, TypeError, ValueError) as e:
+            logging.warning(f"Analysis cache write failed: {e}")
+
+    @staticmethod
+    def make_static_key(language: str, content: str, analyzer_tag: str) -> str:
+        """Build the key for static analyzer results on a piece of code (stored via put/get)."""
+        digest = hashlib.sha256(f"{language}\0{content}".encode('utf-8')).hexdigest()
+        return f"static:{AnalysisCache.SCHEMA_VERSION}:{analyzer_tag}:{digest}"
+
+    @staticmethod
+    def make_response_key(language: str, content: str, model: str, prompt_version: int) -> str:
+        """Build the cache key for the raw LLM response to a piece of code."""
+        digest = hashlib.sha256(f"{language}\0{content}".encode('utf-8')).hexdigest()
+        return f"{AnalysisCache.SCHEMA_VERSION}:{digest}:{model}:{prompt_version}"
+
+    def get_response(self, key: str) -> Optional[str]:
+        """Return the cached raw LLM response for key, or None."""
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT response FROM responses WHERE key = ?", (key,)
+                ).fetchone()
+            return row[0] if row else None
+        except sqlite3.Error as e:
+            logging.warning(f"Response cache read failed: {e}")
+            return None
+
+    def put_response(self, key: str, response: str):
+        """Store a raw LLM response under key."""
+        try:
+            with self._lock, self._conn:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO responses (key, response) VALUES (?, ?)",
+                    (key, response)
+                )
+                self._trim("responses")
+        except sqlite3.Error as e:
+            logging.warning(f"Response cache write failed: {e}")
+
+    def _trim(self, table: str):
+        """Drop the oldest writes past max_entries (caller holds the lock and transaction)."""
+        # Replacing a row gives it a new, highest rowid, so rowid order is write order
+        self._conn.execute(
+            f"DELETE FROM {table} WHERE rowid <= (SELECT MAX(rowid) FROM {table}) - ?",
+            (self.max_entries,)
+        )
+
+    def close(self):
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
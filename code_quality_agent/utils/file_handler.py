@@ -26,13 +26,14 @@ Functions/Classes:
   - `get_file_stats(self, file_path)`: Get file statistics
   - `_count_comment_lines(self, content, language)`: Count comment lines by language
   - `cleanup(self)`: Clean up temporary directories
+- `summarize_file(file_path)`: Language, size and line count for one file
 """
 
 import os
 import tempfile
 import shutil
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from urllib.parse import urlparse
 import subprocess
 
@@ -41,6 +42,36 @@ from git import Repo
 
 from ..config import Config
 
+# Built once instead of on every detect_language call
+LANGUAGE_BY_EXTENSION = {
+    '.py': 'python',
+    '.js': 'javascript',
+    '.jsx': 'javascript',
+    '.ts': 'typescript', 
+    '.tsx': 'typescript',
+    '.java': 'java',
+    '.cpp': 'cpp',
+    '.c': 'c',
+    '.h': 'c',
+    '.cs': 'csharp',
+    '.go': 'go',
+    '.rs': 'rust',
+    '.php': 'php',
+    '.rb': 'ruby',
+    '.swift': 'swift',
+    '.kt': 'kotlin',
+    '.scala': 'scala',
+    '.ipynb': 'jupyter'
+}
+
+# Directories whose contents are never analyzed (dependencies, build output, VCS)
+IGNORED_DIRS = frozenset({
+    '.git', '__pycache__', 'node_modules', '.pytest_cache',
+    'venv', 'env', '.env', 'dist', 'build', '.next',
+    'coverage', '.coverage', '.nyc_output', 'target',
+    'bin', 'obj', '.vs', '.vscode'
+})
+
 
 class FileHandler:
     """Handle file operations and repository cloning."""
@@ -154,12 +185,15 @@ class FileHandler:
             if self._is_supported_file(path_obj):
                 code_files.append(path_obj)
         else:
-            # Directory - walk through files
-            for file_path in path_obj.rglob('*'):
-                if (file_path.is_file() and 
-                    self._is_supported_file(file_path) and
-                    not self._should_ignore_file(file_path)):
-                    code_files.append(file_path)
+            # Directory - walk through files, never descending into ignored directories
+            for dir_path, dir_names, file_names in os.walk(path_obj):
+                dir_names[:] = [d for d in dir_names if d not in IGNORED_DIRS]
+                for file_name in file_names:
+                    file_path = Path(dir_path) / file_name
+                    if (self._is_supported_file(file_path) and
+                        file_path.is_file() and
+                        not self._should_ignore_file(file_path)):
+                        code_files.append(file_path)
         
         # Sort by size (smaller files first for faster analysis)
         code_files.sort(key=lambda f: f.stat().st_size)
@@ -173,16 +207,9 @@ class FileHandler:
     
     def _should_ignore_file(self, file_path: Path) -> bool:
         """Check if file should be ignored."""
-        ignore_patterns = [
-            '.git', '__pycache__', 'node_modules', '.pytest_cache',
-            'venv', 'env', '.env', 'dist', 'build', '.next',
-            'coverage', '.coverage', '.nyc_output', 'target',
-            'bin', 'obj', '.vs', '.vscode'
-        ]
-        
         # Check if any parent directory matches ignore patterns
         for parent in file_path.parents:
-            if parent.name in ignore_patterns:
+            if parent.name in IGNORED_DIRS:
                 return True
         
         # Check file size
@@ -200,28 +227,7 @@ class FileHandler:
     
     def detect_language(self, file_path: Path) -> str:
         """Detect programming language from file extension."""
-        extension_map = {
-            '.py': 'python',
-            '.js': 'javascript',
-            '.jsx': 'javascript',
-            '.ts': 'typescript', 
-            '.tsx': 'typescript',
-            '.java': 'java',
-            '.cpp': 'cpp',
-            '.c': 'c',
-            '.h': 'c',
-            '.cs': 'csharp',
-            '.go': 'go',
-            '.rs': 'rust',
-            '.php': 'php',
-            '.rb': 'ruby',
-            '.swift': 'swift',
-            '.kt': 'kotlin',
-            '.scala': 'scala',
-            '.ipynb': 'jupyter'
-        }
-        
-        return extension_map.get(file_path.suffix.lower(), 'unknown')
+        return LANGUAGE_BY_EXTENSION.get(file_path.suffix.lower(), 'unknown')
     
     def get_file_content(self, file_path: Path) -> Optional[str]:
         """Get file content safely."""
@@ -312,3 +318,17 @@ class FileHandler:
     def __del__(self):
         """Cleanup on destruction."""
         self.cleanup()
+
+
+def summarize_file(file_path: Path) -> Tuple[str, int, int]:
+    """Return (language, size_bytes, total_lines) for a file.
+
+    Module-level so it can be mapped over a worker pool.
+    """
+    handler = FileHandler()
+    stats = handler.get_file_stats(file_path)
+    return (
+        handler.detect_language(file_path),
+        stats.get('size_bytes', 0),
+        stats.get('total_lines', 0)
+    )
@@ -0,0 +1,46 @@
+"""
+Purpose: Fast JSON encoding/decoding for analysis data
+
+High-level Overview:
+Thin wrappers that use orjson (a C extension) when it is installed and fall back to the standard library json module otherwise. Used on the agent's hot paths: parsing LLM responses, building prompts and caching results.
+
+Key Components:
+- Optional orjson acceleration
+- Standard library fallback with identical call signatures
+
+Functions/Classes:
+- `loads(data)`: Parse JSON from str or bytes
+- `dumps(obj, indent=False, sort_keys=False, default=None)`: Serialize an object to a JSON string
+"""
+
+import json
+from typing import Any, Callable, Optional, Union
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """Parse JSON from str or bytes."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any, indent: bool = False, sort_keys: bool = False,
+          default: Optional[Callable[[Any], Any]] = None) -> str:
+    """Serialize obj to a JSON string (two-space indent when requested).
+
+    sort_keys gives a stable encoding for hashing; default converts objects
+    JSON can't represent, as in json.dumps.
+    """
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_INDENT_2 if indent else 0
+        if sort_keys:
+            # The stdlib encoder accepts int/float dict keys; match it
+            option |= orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+        return orjson.dumps(obj, default=default, option=option or None).decode('utf-8')
+    return json.dumps(obj, indent=2 if indent else None, sort_keys=sort_keys, default=default)
@@ -0,0 +1,121 @@
+"""
+Purpose: In-memory semantic cache for LLM file analyses
+
+High-level Overview:
+Maps a sentence-transformer embedding of a file's content to the raw LLM response produced for it. A new file whose embedding is close enough (cosine similarity at or above a threshold) to a cached one, and whose lines mostly match it, reuses that response instead of making another LLM call. Entries are grouped by language and approximate size so each lookup only compares against plausible matches.
+
+Key Components:
+- Optional SentenceTransformer embeddings (loaded lazily on first use), mean-pooled over the whole file
+- Line-hash overlap check confirming each embedding match
+- Normalized vectors compared with a single NumPy matrix-vector product
+- Language/size buckets to prune the search set
+- Global LRU eviction
+
+Functions/Classes:
+- `class SemanticCache`: Embedding-keyed cache of raw LLM responses
+  - `__init__(self, model_name, threshold, max_entries)`: Configure the cache
+  - `is_available(self)`: Check whether embeddings can be computed
+  - `embed(self, content)`: Return a unit-length embedding of all of content (blocking)
+  - `bucket(language, content)`: Scope key an entry is stored and searched under
+  - `line_hashes(content)`: Set of hashes of content's non-blank lines
+  - `get(self, bucket, vector, content)`: Return the closest confirmed cached response above the threshold
+  - `put(self, bucket, vector, content, response)`: Store a response
+"""
+
+import logging
+import threading
+from collections import OrderedDict
+from typing import Dict, FrozenSet, Optional, Tuple
+
+import numpy as np
+
+try:
+    from sentence_transformers import SentenceTransformer
+    SENTENCE_TRANSFORMERS_AVAILABLE = True
+except ImportError:
+    SENTENCE_TRANSFORMERS_AVAILABLE = False
+
+
+class SemanticCache:
+    """Embedding-keyed cache of raw LLM responses."""
+
+    # The model truncates its input, so content is embedded in windows this
+    # many characters long (roughly its 256 word-piece limit for code)
+    WINDOW_CHARS = 768
+    # Share of distinct lines a hit must have in common with the cached file
+    MIN_LINE_OVERLAP = 0.9
+
+    def __init__(self, model_name: str = "all-MiniLM-L6-v2", threshold: float = 0.98, max_entries: int = 1000):
+        """Configure the cache; the embedding model loads on first use."""
+        self.model_name = model_name
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self._model = None
+        self._model_lock = threading.Lock()
+        # bucket -> {entry id -> (vector, line hashes, response)}; _order tracks global LRU
+        self._buckets: Dict[Tuple[str, int], Dict[int, Tuple[np.ndarray, FrozenSet[int], str]]] = {}
+        self._order: "OrderedDict[int, Tuple[str, int]]" = OrderedDict()
+        self._next_id = 0
+
+    def is_available(self) -> bool:
+        """Check whether embeddings can be computed."""
+        return SENTENCE_TRANSFORMERS_AVAILABLE
+
+    def embed(self, content: str) -> np.ndarray:
+        """Return a unit-length embedding of all of content (blocking; run in an executor).
+
+        Each window is embedded separately and the vectors are mean-pooled, so
+        differences past the model's input limit still move the embedding.
+        """
+        with self._model_lock:
+            if self._model is None:
+                logging.info(f"Loading semantic cache model: {self.model_name}")
+                self._model = SentenceTransformer(self.model_name)
+        windows = [content[i:i + self.WINDOW_CHARS] for i in range(0, len(content), self.WINDOW_CHARS)] or [""]
+        pooled = self._model.encode(windows, normalize_embeddings=True).mean(axis=0)
+        return (pooled / (np.linalg.norm(pooled) or 1.0)).astype(np.float32)
+
+    @staticmethod
+    def bucket(language: str, content: str) -> Tuple[str, int]:
+        """Scope key an entry is stored and searched under (language, size in KB)."""
+        return language, len(content) // 1024
+
+    @staticmethod
+    def line_hashes(content: str) -> FrozenSet[int]:
+        """Set of hashes of content's non-blank lines, stripped of indentation."""
+        return frozenset(hash(line.strip()) for line in content.splitlines() if line.strip())
+
+    def get(self, bucket: Tuple[str, int], vector: np.ndarray, content: str) -> Optional[str]:
+        """Return the closest cached response at or above the threshold, or None.
+
+        The embedding match is confirmed by comparing the files' lines, since
+        near-identical embeddings can still come from meaningfully different code.
+        """
+        entries = self._buckets.get(bucket)
+        if not entries:
+            return None
+        ids = list(entries)
+        similarities = np.vstack([entries[i][0] for i in ids]) @ vector
+        best = int(np.argmax(similarities))
+        if similarities[best] < self.threshold:
+            return None
+        _, cached_lines, response = entries[ids[best]]
+        lines = self.line_hashes(content)
+        union = len(lines | cached_lines)
+        if union and len(lines & cached_lines) < self.MIN_LINE_OVERLAP * union:
+            return None
+        self._order.move_to_end(ids[best])
+        return response
+
+    def put(self, bucket: Tuple[str, int], vector: np.ndarray, content: str, response: str):
+        """Store a response, evicting the least recently used entry when full."""
+        entry_id = self._next_id
+        self._next_id += 1
+        self._buckets.setdefault(bucket, {})[entry_id] = (vector, self.line_hashes(content), response)
+        self._order[entry_id] = bucket
+        if len(self._order) > self.max_entries:
+            old_id, old_bucket = self._order.popitem(last=False)
+            old_entries = self._buckets[old_bucket]
+            del old_entries[old_id]
+            if not old_entries:
+                del self._buckets[old_bucket]
@@ -0,0 +1,50 @@
+"""
+Purpose: Start the Streamlit web interface
+
+High-level Overview:
+Shared by the `cqi --web` CLI option and the cqi-web.py launcher. On POSIX the launcher has nothing left to do once Streamlit starts, so the current process is replaced by it; elsewhere Streamlit runs as a child process.
+
+Key Components:
+- Streamlit server command line (localhost:8501, usage stats off)
+- os.execv hand-off on POSIX
+- posix_spawn-friendly subprocess fallback
+
+Functions/Classes:
+- `streamlit_command(app_path)`: Command line serving app_path with Streamlit
+- `run_streamlit(app_path)`: Serve app_path, replacing this process where possible
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+from typing import List
+
+
+def streamlit_command(app_path: Path) -> List[str]:
+    """Command line serving app_path with Streamlit on localhost:8501."""
+    return [
+        sys.executable, "-m", "streamlit", "run", str(app_path),
+        "--server.address", "localhost",
+        "--server.port", "8501",
+        "--browser.gatherUsageStats", "false"
+    ]
+
+
+def run_streamlit(app_path: Path) -> None:
+    """Serve app_path with Streamlit, replacing this process where possible.
+
+    Only returns on platforms without exec, once the server exits. Launch
+    failures raise (OSError, subprocess errors) for the caller to report.
+    """
+    cmd = streamlit_command(app_path)
+
+    if os.name == "posix":
+        # Nothing is left to do here, so let streamlit replace this
+        # interpreter instead of keeping it alive as an idle parent
+        sys.stdout.flush()
+        os.execv(sys.executable, cmd)
+
+    # close_fds=False (with no cwd/preexec_fn) lets CPython use posix_spawn
+    # instead of fork+exec; Python-created fds are non-inheritable anyway
+    subprocess.run(cmd, close_fds=False)
@@ -16,10 +16,11 @@ Functions/Classes:
   - Launches web interface with proper error handling
 """
 
-import subprocess
 import sys
 from pathlib import Path
 
+from code_quality_agent.utils.web_launcher import run_streamlit
+
 def main():
     """Launch the web interface."""
     script_dir = Path(__file__).parent
@@ -36,12 +37,7 @@ def main():
     print()
     
     try:
-        subprocess.run([
-            sys.executable, "-m", "streamlit", "run", str(app_path),
-            "--server.address", "localhost",
-            "--server.port", "8501",
-            "--browser.gatherUsageStats", "false"
-        ])
+        run_streamlit(app_path)
     except KeyboardInterrupt:
         print("\nWeb interface stopped by user")
     except Exception as e:
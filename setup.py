@@ -79,10 +79,11 @@ setup(
         "pygments==2.17.2",
         "pathspec==0.12.1",
         "tqdm==4.66.2",
+        "numpy==1.26.4",
     ],
     extras_require={
         "full": [
-            "streamlit==1.31.0",
+            "streamlit==1.37.0",
             "pandas==2.2.0", 
             "matplotlib==3.8.4",
             "plotly==5.19.0",
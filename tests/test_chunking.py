@@ -0,0 +1,70 @@
+"""
+Tests for splitting large files into overlapping analysis chunks.
+"""
+
+import sys
+import unittest
+from importlib.util import find_spec
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+
+def python_source(classes: int) -> str:
+    """Build a Python module of long classes, so top-level lines are sparse."""
+    method = "\n".join(f"        value_{j} = {j} * 2  # padding to grow the file" for j in range(40))
+    body = "\n".join(f"    def method_{m}(self):\n{method}\n" for m in range(25))
+    return "\n".join(f"class Model{i}:\n{body}\n" for i in range(classes))
+
+
+def js_source(functions: int) -> str:
+    """Build a JavaScript module of long functions, so block ends are sparse."""
+    body = "\n".join(f"    const value{j} = {j} * 2; // padding to grow the file" for j in range(1000))
+    return "\n".join(f"function f{i}() {{\n{body}\n    return {i};\n}}\n" for i in range(functions))
+
+
+@unittest.skipUnless(find_spec("langchain_groq"), "LLM dependencies not installed")
+class ChunkCoverageTests(unittest.TestCase):
+    """Every line of a chunked file must land in at least one chunk."""
+
+    def setUp(self):
+        from code_quality_agent.agent import CodeQualityAgent
+        # Chunking needs no LLM or analyzer state
+        self.agent = CodeQualityAgent.__new__(CodeQualityAgent)
+
+    def assert_covered(self, content: str, language: str):
+        chunks = self.agent._create_code_chunks(content, language)
+        lines = content.split("\n")
+        covered = set()
+        for chunk in chunks:
+            self.assertEqual(chunk["content"], "\n".join(lines[chunk["start_line"] - 1:chunk["end_line"]]))
+            covered.update(range(chunk["start_line"], chunk["end_line"] + 1))
+        self.assertGreater(len(chunks), 1)
+        self.assertEqual(covered, set(range(1, len(lines) + 1)))
+        return chunks
+
+    def test_python_chunks_cover_every_line(self):
+        self.assert_covered(python_source(60), "python")
+
+    def test_javascript_chunks_cover_every_line(self):
+        self.assert_covered(js_source(60), "javascript")
+
+    def test_unbounded_language_chunks_cover_every_line(self):
+        self.assert_covered(python_source(60), "go")
+
+    def test_long_lines_keep_chunk_count_bounded(self):
+        # About 52 lines fit in a chunk; after boundary trimming and the capped
+        # overlap each step still advances 30+ lines (an uncapped one advanced 1)
+        content = "\n".join(f"x{i} = '{'a' * 5000}'" for i in range(400))
+        for language in ("python", "javascript", "go"):
+            chunks = self.assert_covered(content, language)
+            self.assertLessEqual(len(chunks), 13)
+
+    def test_lines_longer_than_a_chunk(self):
+        content = "\n".join(f"x{i} = '{'a' * 300000}'" for i in range(3))
+        chunks = self.assert_covered(content, "go")
+        self.assertEqual(len(chunks), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()